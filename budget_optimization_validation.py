@@ -3,33 +3,79 @@
 Comprehensive validation of Budget Optimization Algorithm
 """
 
+import io
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+# Try to import optional JIT compiler for large scenario sweeps
+try:
+    import numba as nb
+    NUMBA_AVAILABLE = True
+    njit, prange = nb.njit, nb.prange
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator: run the kernel as plain Python"""
+        return lambda func: func
+
+# Constants from the algorithm
+TOTAL_POPULATION = 47_840_590
+CHILDREN_UNDER_5 = int(TOTAL_POPULATION * 0.15)
+PREGNANT_WOMEN = int(TOTAL_POPULATION * 0.038)
+LACTATING_WOMEN = int(TOTAL_POPULATION * 0.045)
+TARGET_POPULATION = CHILDREN_UNDER_5 + PREGNANT_WOMEN + LACTATING_WOMEN  # 11,146,856
+ANNUAL_COST_PER_PERSON = 40_000  # UGX
+FULL_COVERAGE_BUDGET = TARGET_POPULATION * ANNUAL_COST_PER_PERSON
+
+@njit(parallel=True, fastmath=True, cache=True)
+def compute_roi_curve(budgets, target_population, annual_cost, base_benefit):
+    """Coverage, efficiency and ROI (%) for each budget in a sweep"""
+    
+    n = budgets.size
+    coverage = np.empty(n)
+    efficiency = np.empty(n)
+    roi = np.empty(n)
+    full_coverage_budget = target_population * annual_cost
+    
+    for i in prange(n):
+        c = min(1.0, budgets[i] / full_coverage_budget)
+        e = 1.0 - (0.3 * c)
+        coverage[i] = c
+        efficiency[i] = e
+        roi[i] = ((base_benefit * c * e - budgets[i]) / budgets[i] * 100.0) if budgets[i] > 0 else 0.0
+    
+    return coverage, efficiency, roi
+
 def detailed_algorithm_analysis():
     """Detailed step-by-step algorithm analysis"""
     
-    print("="*80)
-    print("BUDGET OPTIMIZATION ALGORITHM: DETAILED MATHEMATICAL ANALYSIS")
-    print("="*80)
+    # Collect the report and write it to stdout in one call
+    buf = io.StringIO()
+    
+    print("="*80, file=buf)
+    print("BUDGET OPTIMIZATION ALGORITHM: DETAILED MATHEMATICAL ANALYSIS", file=buf)
+    print("="*80, file=buf)
     
     # Constants from the algorithm
-    total_population = 47_840_590
-    children_under_5 = int(total_population * 0.15)
-    pregnant_women = int(total_population * 0.038)
-    lactating_women = int(total_population * 0.045)
-    target_population = children_under_5 + pregnant_women + lactating_women
-    annual_cost_per_person = 40_000  # UGX
-    
-    print("\n1. POPULATION PARAMETERS:")
-    print(f"   Total Uganda Population: {total_population:,}")
-    print(f"   Target Population: {target_population:,} ({target_population/total_population*100:.1f}% of total)")
-    print(f"   - Children <5: {children_under_5:,} (15.0%)")
-    print(f"   - Pregnant: {pregnant_women:,} (3.8%)")
-    print(f"   - Lactating: {lactating_women:,} (4.5%)")
-    
-    print("\n2. COST STRUCTURE (UGX per person per year):")
+    total_population = TOTAL_POPULATION
+    children_under_5 = CHILDREN_UNDER_5
+    pregnant_women = PREGNANT_WOMEN
+    lactating_women = LACTATING_WOMEN
+    target_population = TARGET_POPULATION
+    annual_cost_per_person = ANNUAL_COST_PER_PERSON
+    
+    print("\n1. POPULATION PARAMETERS:", file=buf)
+    print(f"   Total Uganda Population: {total_population:,}", file=buf)
+    print(f"   Target Population: {target_population:,} ({target_population/total_population*100:.1f}% of total)", file=buf)
+    print(f"   - Children <5: {children_under_5:,} (15.0%)", file=buf)
+    print(f"   - Pregnant: {pregnant_women:,} (3.8%)", file=buf)
+    print(f"   - Lactating: {lactating_women:,} (4.5%)", file=buf)
+    
+    print("\n2. COST STRUCTURE (UGX per person per year):", file=buf)
     cost_breakdown = {
         'Supplementation': 18_000,
         'Fortification': 8_000,
@@ -38,43 +84,45 @@ def detailed_algorithm_analysis():
         'Delivery': 6_000
     }
     for item, cost in cost_breakdown.items():
-        print(f"   {item}: {cost:,} ({cost/annual_cost_per_person*100:.1f}%)")
-    print(f"   TOTAL: {annual_cost_per_person:,}")
-    
-    print("\n3. COVERAGE CALCULATION:")
-    print("   Coverage = min(1.0, budget / (target_population × annual_cost_per_person))")
-    print(f"   Full coverage budget = {target_population:,} × {annual_cost_per_person:,}")
-    print(f"   = {target_population * annual_cost_per_person:,} UGX")
-    print(f"   = {target_population * annual_cost_per_person / 1_000_000:,.0f} Million UGX")
-    
-    print("\n4. HEALTH IMPACT PARAMETERS:")
-    print("   Mortality:")
-    print(f"   - Under-5 mortality rate: 46.4 per 1,000")
-    print(f"   - Reduction potential: 23%")
-    print("   Stunting:")
-    print(f"   - Prevalence: 23.2% of children")
-    print(f"   - Reduction potential: 36%")
-    print("   Anemia:")
-    print(f"   - Children prevalence: 53%")
-    print(f"   - Women prevalence: 28%")
-    print(f"   - Reduction potential: 42%")
-    
-    print("\n5. ECONOMIC VALUATION (UGX):")
-    print(f"   Value per life saved: 150,000,000")
-    print(f"   Value per stunting prevented: 25,000,000")
-    print(f"   Value per anemia case prevented: 2,000,000")
-    
-    print("\n6. EFFICIENCY FACTOR:")
-    print("   Efficiency = 1.0 - (0.3 × coverage)")
-    print("   This creates diminishing returns:")
-    print("   - At 0% coverage: 100% efficiency")
-    print("   - At 50% coverage: 85% efficiency")
-    print("   - At 100% coverage: 70% efficiency")
-    
-    print("\n7. ROI CALCULATION:")
-    print("   Total Benefit = mortality_benefit + stunting_benefit + anemia_benefit")
-    print("   Adjusted Benefit = Total Benefit × Efficiency")
-    print("   ROI = ((Adjusted Benefit - Budget) / Budget) × 100")
+        print(f"   {item}: {cost:,} ({cost/annual_cost_per_person*100:.1f}%)", file=buf)
+    print(f"   TOTAL: {annual_cost_per_person:,}", file=buf)
+    
+    print("\n3. COVERAGE CALCULATION:", file=buf)
+    print("   Coverage = min(1.0, budget / (target_population × annual_cost_per_person))", file=buf)
+    print(f"   Full coverage budget = {target_population:,} × {annual_cost_per_person:,}", file=buf)
+    print(f"   = {FULL_COVERAGE_BUDGET:,} UGX", file=buf)
+    print(f"   = {FULL_COVERAGE_BUDGET / 1_000_000:,.0f} Million UGX", file=buf)
+    
+    print("\n4. HEALTH IMPACT PARAMETERS:", file=buf)
+    print("   Mortality:", file=buf)
+    print(f"   - Under-5 mortality rate: 46.4 per 1,000", file=buf)
+    print(f"   - Reduction potential: 23%", file=buf)
+    print("   Stunting:", file=buf)
+    print(f"   - Prevalence: 23.2% of children", file=buf)
+    print(f"   - Reduction potential: 36%", file=buf)
+    print("   Anemia:", file=buf)
+    print(f"   - Children prevalence: 53%", file=buf)
+    print(f"   - Women prevalence: 28%", file=buf)
+    print(f"   - Reduction potential: 42%", file=buf)
+    
+    print("\n5. ECONOMIC VALUATION (UGX):", file=buf)
+    print(f"   Value per life saved: 150,000,000", file=buf)
+    print(f"   Value per stunting prevented: 25,000,000", file=buf)
+    print(f"   Value per anemia case prevented: 2,000,000", file=buf)
+    
+    print("\n6. EFFICIENCY FACTOR:", file=buf)
+    print("   Efficiency = 1.0 - (0.3 × coverage)", file=buf)
+    print("   This creates diminishing returns:", file=buf)
+    print("   - At 0% coverage: 100% efficiency", file=buf)
+    print("   - At 50% coverage: 85% efficiency", file=buf)
+    print("   - At 100% coverage: 70% efficiency", file=buf)
+    
+    print("\n7. ROI CALCULATION:", file=buf)
+    print("   Total Benefit = mortality_benefit + stunting_benefit + anemia_benefit", file=buf)
+    print("   Adjusted Benefit = Total Benefit × Efficiency", file=buf)
+    print("   ROI = ((Adjusted Benefit - Budget) / Budget) × 100", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
 
 def validate_algorithm_behavior():
     """Validate expected algorithm behavior patterns"""
@@ -93,38 +141,38 @@ def validate_algorithm_behavior():
         {'name': 'Over-provisioned', 'budget_m': 10000}
     ]
     
-    results = []
-    target_population = 11_146_856
-    annual_cost = 40_000
-    
-    for scenario in test_scenarios:
-        budget = scenario['budget_m'] * 1_000_000
-        coverage = min(1.0, budget / (target_population * annual_cost))
-        efficiency = 1.0 - (0.3 * coverage)
-        
-        # Simplified ROI calculation for validation
-        # Assuming linear benefit scaling with coverage
-        base_benefit_per_coverage = 15_000_000_000  # Estimated from algorithm
-        total_benefit = base_benefit_per_coverage * coverage
-        adjusted_benefit = total_benefit * efficiency
-        roi = ((adjusted_benefit - budget) / budget * 100) if budget > 0 else 0
-        
-        results.append({
-            'Scenario': scenario['name'],
-            'Budget (M)': scenario['budget_m'],
-            'Coverage (%)': coverage * 100,
-            'Efficiency': efficiency,
-            'ROI (%)': roi
-        })
-    
-    df = pd.DataFrame(results)
+    names = [scenario['name'] for scenario in test_scenarios]
+    budgets_m = np.fromiter((scenario['budget_m'] for scenario in test_scenarios),
+                            dtype=np.int64, count=len(test_scenarios))
+    
+    # Simplified ROI calculation for validation
+    # Assuming linear benefit scaling with coverage
+    base_benefit_per_coverage = 15_000_000_000  # Estimated from algorithm
+    budgets = budgets_m * 1_000_000.0
+    coverage, efficiency, roi = compute_roi_curve(
+        budgets, TARGET_POPULATION, ANNUAL_COST_PER_PERSON, base_benefit_per_coverage
+    )
+    
+    # Validation checks run on the source arrays, before any DataFrame exists
+    checks = [
+        ("1. Coverage caps at 100%: ", np.all(coverage <= 1.0)),
+        ("2. Efficiency decreases with coverage: ", np.all(np.diff(efficiency) <= 0)),
+        ("3. ROI shows diminishing returns: ", roi[2] > roi[-1])
+    ]
+    
+    df = pd.DataFrame({
+        'Scenario': names,
+        'Budget (M)': budgets_m,
+        'Coverage (%)': coverage * 100,
+        'Efficiency': efficiency,
+        'ROI (%)': roi
+    })
     print("\nScenario Analysis:")
     print(df.to_string(index=False))
     
     print("\n✓ VALIDATION CHECKS:")
-    print("1. Coverage caps at 100%: ", "PASS" if all(df['Coverage (%)'] <= 100) else "FAIL")
-    print("2. Efficiency decreases with coverage: ", "PASS" if all(df['Efficiency'].diff()[1:] <= 0) else "FAIL")
-    print("3. ROI shows diminishing returns: ", "PASS" if df['ROI (%)'].iloc[2] > df['ROI (%)'].iloc[-1] else "FAIL")
+    for label, passed in checks:
+        print(label, "PASS" if passed else "FAIL")
     
     return df
 
@@ -147,21 +195,17 @@ def analyze_user_data():
 8    4500    1.1107679523797487    112499    772    6048    20834    6736.431654067212
 9    5000    1.2341866137552764    125000    858    6721    23149    6735.058736311389"""
     
-    data = []
-    for line in user_data_str.strip().split('\n'):
-        parts = line.split()
-        data.append({
-            'Index': int(parts[0]),
-            'Budget': float(parts[1]),
-            'Coverage_Ratio': float(parts[2]),
-            'Total_Cost': float(parts[3]),
-            'Lives_Saved': int(parts[4]),
-            'Stunting_Prevented': int(parts[5]),
-            'Anemia_Prevented': int(parts[6]),
-            'ROI_or_Value': float(parts[7])
-        })
-    
-    df = pd.DataFrame(data)
+    table = np.loadtxt(io.StringIO(user_data_str))
+    df = pd.DataFrame({
+        'Index': table[:, 0].astype(np.int64),
+        'Budget': table[:, 1],
+        'Coverage_Ratio': table[:, 2],
+        'Total_Cost': table[:, 3],
+        'Lives_Saved': table[:, 4].astype(np.int64),
+        'Stunting_Prevented': table[:, 5].astype(np.int64),
+        'Anemia_Prevented': table[:, 6].astype(np.int64),
+        'ROI_or_Value': table[:, 7]
+    })
     
     print("\nUser Data Interpretation:")
     print("1. Budget Range: {} to {} (units unclear, likely millions)".format(df['Budget'].min(), df['Budget'].max()))
@@ -170,10 +214,11 @@ def analyze_user_data():
     
     # Calculate expected values based on budget
     print("\nCross-validation with Algorithm:")
-    for _, row in df.iterrows():
-        budget_m = row['Budget']
-        expected_coverage = budget_m * 1_000_000 / (11_146_856 * 40_000) * 100
-        print(f"Budget {budget_m:4.0f}M: Coverage {row['Coverage_Ratio']*100:6.2f}% (Expected: {expected_coverage:6.2f}%)")
+    budgets_m = df['Budget'].to_numpy()
+    coverage_pct = df['Coverage_Ratio'].to_numpy() * 100
+    expected_coverage = budgets_m * 1_000_000 / FULL_COVERAGE_BUDGET * 100
+    for budget_m, coverage, expected in zip(budgets_m, coverage_pct, expected_coverage):
+        print(f"Budget {budget_m:4.0f}M: Coverage {coverage:6.2f}% (Expected: {expected:6.2f}%)")
     
     # Verify diminishing returns pattern
     print("\nDiminishing Returns Verification:")
@@ -183,13 +228,15 @@ def analyze_user_data():
     print(f"ROI decline after peak: {roi_values[peak_idx] - roi_values[-1]:.2f} points")
     
     # Calculate marginal returns
-    df['Marginal_ROI'] = df['ROI_or_Value'].diff()
-    df['Marginal_Lives'] = df['Lives_Saved'].diff()
+    marginal_roi = np.diff(roi_values)
+    marginal_lives = np.diff(df['Lives_Saved'].to_numpy())
+    df['Marginal_ROI'] = np.concatenate(([np.nan], marginal_roi))
+    df['Marginal_Lives'] = np.concatenate(([np.nan], marginal_lives))
     
     print("\nMarginal Analysis:")
     print("Budget | Marginal ROI | Marginal Lives Saved")
-    for i in range(1, len(df)):
-        print(f"{df.iloc[i]['Budget']:5.0f} | {df.iloc[i]['Marginal_ROI']:12.2f} | {df.iloc[i]['Marginal_Lives']:8.0f}")
+    for budget_m, roi_change, lives_change in zip(budgets_m[1:], marginal_roi, marginal_lives):
+        print(f"{budget_m:5.0f} | {roi_change:12.2f} | {lives_change:8.0f}")
     
     return df
 
@@ -7,6 +7,32 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 import difflib
+import re
+
+# Try to import optional fast fuzzy matching library
+try:
+    from rapidfuzz import process, fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+def _upper_unique(series: pd.Series) -> set:
+    """Uppercase the distinct values of a series (one string op per unique name)"""
+    
+    return set(pd.Series(series.unique(), dtype=object).str.upper())
+
+def _upper_districts(series: pd.Series, mapping: Optional[Dict[str, str]] = None) -> pd.Series:
+    """Uppercase (and optionally remap) a district column by transforming its categories, not every row"""
+    
+    categorical = series.astype('category')
+    names = categorical.cat.categories.str.upper()
+    if mapping:
+        names = names.map(lambda name: mapping.get(name, name))
+    
+    # Code -1 (missing) picks the trailing NaN slot
+    lookup = np.append(np.asarray(names, dtype=object), np.nan)
+    return pd.Series(lookup.take(categorical.cat.codes.to_numpy()),
+                     index=series.index, name=series.name)
 
 class DataValidator:
     """Validates and reconciles data across different sources"""
@@ -18,6 +44,14 @@ class DataValidator:
             'info': [],
             'fixes_applied': []
         }
+        # Running totals so get_validation_summary does not re-count the lists
+        self._counts = {level: 0 for level in self.validation_results}
+    
+    def _log(self, level: str, message: str):
+        """Record a validation message and bump its running count"""
+        
+        self.validation_results[level].append(message)
+        self._counts[level] += 1
         
     def validate_district_names(self, 
                                nutrition_df: pd.DataFrame,
@@ -31,56 +65,112 @@ class DataValidator:
         """
         
         # Extract district names from each dataset
-        nutrition_districts = set(nutrition_df['District'].str.upper().unique()) if 'District' in nutrition_df.columns else set()
-        population_districts = set(population_df['ADM2_EN'].str.upper().unique()) if 'ADM2_EN' in population_df.columns else set()
-        facilities_districts = set(facilities_df['District'].str.upper().unique()) if 'District' in facilities_df.columns else set()
-        
-        # Find mismatches
-        all_districts = nutrition_districts | population_districts | facilities_districts
+        nutrition_districts = _upper_unique(nutrition_df['District']) if 'District' in nutrition_df.columns else set()
+        population_districts = _upper_unique(population_df['ADM2_EN']) if 'ADM2_EN' in population_df.columns else set()
+        facilities_districts = _upper_unique(facilities_df['District']) if 'District' in facilities_df.columns else set()
+        
+        # Fast path: identical district sets need no set algebra or fuzzy matching
+        if nutrition_districts == population_districts == facilities_districts:
+            self._log('info',
+                f"Found {len(nutrition_districts)} districts common to all datasets"
+            )
+            return {
+                'total_unique_districts': len(nutrition_districts),
+                'nutrition_only': set(),
+                'population_only': set(),
+                'facilities_only': set(),
+                'common_to_all': set(nutrition_districts),
+                'mapping': {}
+            }
+        
+        # Find mismatches: tag each district with a membership bitmask
+        # (1 = nutrition, 2 = population, 4 = facilities) and bucket by mask
+        membership = {}
+        for bit, districts in ((1, nutrition_districts), (2, population_districts), (4, facilities_districts)):
+            for district in districts:
+                membership[district] = membership.get(district, 0) | bit
+        
+        buckets = {1: set(), 2: set(), 4: set(), 7: set()}
+        potential_matches = set()
+        for district, mask in membership.items():
+            if mask in buckets:
+                buckets[mask].add(district)
+            if mask & 6:
+                potential_matches.add(district)
         
         results = {
-            'total_unique_districts': len(all_districts),
-            'nutrition_only': nutrition_districts - (population_districts | facilities_districts),
-            'population_only': population_districts - (nutrition_districts | facilities_districts),
-            'facilities_only': facilities_districts - (nutrition_districts | population_districts),
-            'common_to_all': nutrition_districts & population_districts & facilities_districts,
+            'total_unique_districts': len(membership),
+            'nutrition_only': buckets[1],
+            'population_only': buckets[2],
+            'facilities_only': buckets[4],
+            'common_to_all': buckets[7],
             'mapping': {}
         }
         
         # Create fuzzy matching for mismatched districts
         unmatched_nutrition = results['nutrition_only']
-        potential_matches = population_districts | facilities_districts
+        
+        matches = self._match_districts(unmatched_nutrition, potential_matches)
         
         for district in unmatched_nutrition:
-            # Find closest match using fuzzy matching
-            matches = difflib.get_close_matches(district, potential_matches, n=1, cutoff=0.8)
-            if matches:
-                results['mapping'][district] = matches[0]
-                self.validation_results['fixes_applied'].append(
-                    f"Mapped '{district}' to '{matches[0]}'"
+            if district in matches:
+                results['mapping'][district] = matches[district]
+                self._log('fixes_applied',
+                    f"Mapped '{district}' to '{matches[district]}'"
                 )
             else:
-                self.validation_results['warnings'].append(
+                self._log('warnings',
                     f"No match found for district '{district}'"
                 )
         
         # Log validation results
-        self.validation_results['info'].append(
+        self._log('info',
             f"Found {len(results['common_to_all'])} districts common to all datasets"
         )
         
         if results['nutrition_only']:
-            self.validation_results['warnings'].append(
+            self._log('warnings',
                 f"{len(results['nutrition_only'])} districts only in nutrition data"
             )
         
         if results['population_only']:
-            self.validation_results['warnings'].append(
+            self._log('warnings',
                 f"{len(results['population_only'])} districts only in population data"
             )
             
         return results
     
+    def _match_districts(self, districts, candidates) -> Dict[str, str]:
+        """
+        Find the closest candidate name for each district (similarity >= 80%)
+        
+        Returns:
+            Dictionary mapping each matched district to its closest candidate
+        """
+        
+        districts = list(districts)
+        candidates = sorted(candidates)
+        if not districts or not candidates:
+            return {}
+        
+        if RAPIDFUZZ_AVAILABLE:
+            # Score the full district x candidate matrix in a single call
+            scores = process.cdist(districts, candidates, scorer=fuzz.ratio, score_cutoff=80)
+            best = scores.argmax(axis=1)
+            best_scores = scores[np.arange(len(districts)), best]
+            return {
+                district: candidates[idx]
+                for district, idx, score in zip(districts, best, best_scores)
+                if score >= 80
+            }
+        
+        matches = {}
+        for district in districts:
+            close = difflib.get_close_matches(district, candidates, n=1, cutoff=0.8)
+            if close:
+                matches[district] = close[0]
+        return matches
+    
     def validate_nutrient_data(self, nutrition_df: pd.DataFrame) -> Dict:
         """
         Validate nutrient adequacy data for consistency
@@ -98,29 +188,35 @@ class DataValidator:
             'invalid_ranges': {}
         }
         
-        for nutrient in nutrient_columns:
+        # Scan every nutrient column in one pass over a single float array
+        # (na_value lets nullable Int64/Float64 columns convert with pd.NA as NaN)
+        values = nutrition_df[nutrient_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        negative = values < 0
+        too_high = values > 200
+        missing_counts = np.count_nonzero(np.isnan(values), axis=0)
+        outlier_counts = np.count_nonzero(negative | too_high, axis=0)
+        has_negative = negative.any(axis=0)
+        
+        for nutrient, missing_count, outlier_count, negative_found in zip(
+                nutrient_columns, missing_counts, outlier_counts, has_negative):
             # Check for missing values
-            missing_count = nutrition_df[nutrient].isna().sum()
             if missing_count > 0:
-                results['missing_values'][nutrient] = missing_count
-                self.validation_results['warnings'].append(
+                results['missing_values'][nutrient] = int(missing_count)
+                self._log('warnings',
                     f"Missing {missing_count} values for {nutrient}"
                 )
             
             # Check for outliers (values > 200% or < 0%)
-            outliers = nutrition_df[
-                (nutrition_df[nutrient] > 200) | (nutrition_df[nutrient] < 0)
-            ]
-            if not outliers.empty:
-                results['outliers'][nutrient] = len(outliers)
-                self.validation_results['errors'].append(
-                    f"Found {len(outliers)} outlier values for {nutrient}"
+            if outlier_count > 0:
+                results['outliers'][nutrient] = int(outlier_count)
+                self._log('errors',
+                    f"Found {outlier_count} outlier values for {nutrient}"
                 )
             
             # Check for invalid ranges
-            if nutrition_df[nutrient].min() < 0:
+            if negative_found:
                 results['invalid_ranges'][nutrient] = 'negative_values'
-                self.validation_results['errors'].append(
+                self._log('errors',
                     f"Negative values found for {nutrient}"
                 )
         
@@ -148,23 +244,22 @@ class DataValidator:
             zero_pop = population_df[population_df['T_TL'] <= 0]
             if not zero_pop.empty:
                 results['districts_with_zero_pop'] = zero_pop['ADM2_EN'].tolist()
-                self.validation_results['errors'].append(
+                self._log('errors',
                     f"Found {len(zero_pop)} districts with zero/negative population"
                 )
             
             # Check for population anomalies (too high or too low)
-            mean_pop = population_df['T_TL'].mean()
-            std_pop = population_df['T_TL'].std()
+            population = population_df['T_TL'].to_numpy(dtype=np.float64)
+            mean_pop = np.nanmean(population)
+            std_pop = np.nanstd(population, ddof=1)
             
-            anomalies = population_df[
-                (population_df['T_TL'] > mean_pop + 3 * std_pop) |
-                (population_df['T_TL'] < mean_pop - 3 * std_pop)
-            ]
+            anomaly_idx = np.flatnonzero(np.abs(population - mean_pop) > 3 * std_pop)
             
-            if not anomalies.empty:
-                results['population_anomalies'] = anomalies[['ADM2_EN', 'T_TL']].to_dict('records')
-                self.validation_results['info'].append(
-                    f"Found {len(anomalies)} districts with unusual population values"
+            if anomaly_idx.size:
+                anomalies = population_df[['ADM2_EN', 'T_TL']].iloc[anomaly_idx]
+                results['population_anomalies'] = anomalies.to_dict('records')
+                self._log('info',
+                    f"Found {anomaly_idx.size} districts with unusual population values"
                 )
         
         return results
@@ -183,17 +278,17 @@ class DataValidator:
         
         # Apply mapping to nutrition data
         nutrition_df_fixed = nutrition_df.copy()
+        
+        # Ensure all district names are uppercase, remapping in the same lookup
+        nutrition_df_fixed['District'] = _upper_districts(nutrition_df_fixed['District'], mapping)
         if mapping:
-            nutrition_df_fixed['District'] = nutrition_df_fixed['District'].str.upper().replace(mapping)
-            self.validation_results['fixes_applied'].append(
+            self._log('fixes_applied',
                 f"Applied {len(mapping)} district name mappings"
             )
         
-        # Ensure all district names are uppercase for consistency
-        nutrition_df_fixed['District'] = nutrition_df_fixed['District'].str.upper()
-        population_df['ADM2_EN'] = population_df['ADM2_EN'].str.upper()
+        population_df['ADM2_EN'] = _upper_districts(population_df['ADM2_EN'])
         if 'District' in facilities_df.columns:
-            facilities_df['District'] = facilities_df['District'].str.upper()
+            facilities_df['District'] = _upper_districts(facilities_df['District'])
         
         return nutrition_df_fixed, population_df, facilities_df
     
@@ -251,12 +346,24 @@ class DataValidator:
         """Get summary of all validation results"""
         
         return {
-            'errors': len(self.validation_results['errors']),
-            'warnings': len(self.validation_results['warnings']),
-            'fixes_applied': len(self.validation_results['fixes_applied']),
+            'errors': self._counts['errors'],
+            'warnings': self._counts['warnings'],
+            'fixes_applied': self._counts['fixes_applied'],
             'details': self.validation_results
         }
 
+# District name cleanup rules
+DISTRICT_AFFIX_PATTERN = re.compile(r'^\s+|\s+$| DISTRICT|DISTRICT ')
+
+COMMON_DISTRICT_FIXES = {
+    'KALANGALA': 'KALANGALA',
+    'KALANGLA': 'KALANGALA',
+    'SEMBABULE': 'SSEMBABULE',
+    'LUWERO': 'LUWEERO',
+    'BUNDIBUGYO': 'BUNDIBUGYO',
+    'BUNDIBUJO': 'BUNDIBUGYO'
+}
+
 # Utility function for data cleaning
 def clean_and_standardize_districts(df: pd.DataFrame, district_column: str) -> pd.DataFrame:
     """
@@ -270,31 +377,19 @@ def clean_and_standardize_districts(df: pd.DataFrame, district_column: str) -> p
         Cleaned DataFrame
     """
     
-    df = df.copy()
-    
-    # Remove leading/trailing whitespace
-    df[district_column] = df[district_column].str.strip()
-    
-    # Convert to uppercase for consistency
-    df[district_column] = df[district_column].str.upper()
-    
-    # Remove common suffixes/prefixes
-    df[district_column] = df[district_column].str.replace(' DISTRICT', '')
-    df[district_column] = df[district_column].str.replace('DISTRICT ', '')
+    # Uppercase, then strip whitespace and the DISTRICT prefix/suffix in one pass
+    districts = df[district_column].str.upper().str.replace(
+        DISTRICT_AFFIX_PATTERN, '', regex=True
+    )
     
     # Fix common misspellings
-    common_fixes = {
-        'KALANGALA': 'KALANGALA',
-        'KALANGLA': 'KALANGALA',
-        'SEMBABULE': 'SSEMBABULE',
-        'LUWERO': 'LUWEERO',
-        'BUNDIBUGYO': 'BUNDIBUGYO',
-        'BUNDIBUJO': 'BUNDIBUGYO'
-    }
-    
-    df[district_column] = df[district_column].replace(common_fixes)
+    districts = districts.map(lambda name: COMMON_DISTRICT_FIXES.get(name, name))
     
-    return df
+    # Replace only the district column on a shallow copy: the other columns
+    # share the caller's data and the input frame is left untouched
+    out = df.copy(deep=False)
+    out[district_column] = districts
+    return out
 
 # Example usage
 if __name__ == "__main__":
@@ -5,8 +5,280 @@ Distribution and supply chain metric cards with three-tier information hierarchy
 Following the same UI implementation pattern as executive dashboard cards
 """
 
+import bisect
+import functools
+import sys
+import types
 import streamlit as st
-from typing import Dict, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Shared card stylesheet; only the standalone page below needs it, the main
+# dashboard applies it itself
+try:
+    from uganda_card_components import apply_card_styling
+    CARD_STYLING_AVAILABLE = True
+except ImportError:
+    CARD_STYLING_AVAILABLE = False
+
+# Fields each card reads; only these feed the card's cache key
+_TOTAL_FACILITIES_KEYS = ('total_facilities', 'health_centers', 'hospitals', 'warehouses', 'mobile_units')
+_ACTIVE_POINTS_KEYS = ('active_points', 'total_points', 'urban_points', 'rural_points')
+_LEAD_TIME_KEYS = ('lead_time', 'target_lead_time', 'min_lead_time', 'max_lead_time')
+_TURNOVER_KEYS = ('turnover_rate', 'days_on_hand', 'reorder_point', 'waste_rate')
+_FILL_RATE_KEYS = ('fill_rate', 'target_fill_rate', 'backorders', 'on_time_delivery')
+_DERIVED_KEYS = ('active_points', 'total_points', 'lead_time', 'turnover_rate', 'waste_rate', 'fill_rate', 'backorders')
+
+# Display strings repeat across reruns, so each distinct one is parsed once
+@functools.lru_cache(maxsize=128)
+def _parse_days(value):
+    """'3.1 days' -> 3.1; numbers pass through"""
+    return float(value.split()[0]) if isinstance(value, str) else value
+
+@functools.lru_cache(maxsize=128)
+def _parse_pct(value):
+    """'90.7%' -> 90.7; numbers pass through"""
+    return float(value.rstrip('%')) if isinstance(value, str) else value
+
+@functools.lru_cache(maxsize=128)
+def _parse_turnover(value):
+    """'3.2x/month' -> 3.2; anything unparseable falls back to 3.2"""
+    return float(value.split('x')[0]) if isinstance(value, str) and 'x' in value else 3.2
+
+class DerivedMetrics(NamedTuple):
+    """Numbers parsed out of the network display strings, used to rate the cards"""
+    utilization: float
+    lead_time_value: float
+    turnover_value: float
+    waste_value: float
+    fill_value: float
+    backorder_count: int
+
+@st.cache_data(max_entries=64, ttl=300, show_spinner=False)
+def _derive(raw: Tuple) -> DerivedMetrics:
+    """Parse the rated fields once per distinct network snapshot"""
+    
+    get = dict(raw).get
+    active_points = get('active_points', '72')
+    total_points = get('total_points', '94')
+    return DerivedMetrics(
+        utilization=float(active_points) / float(total_points) * 100 if total_points else 0,
+        lead_time_value=_parse_days(get('lead_time', '3.1 days')),
+        turnover_value=_parse_turnover(get('turnover_rate', '3.2x/month')),
+        waste_value=_parse_pct(get('waste_rate', '2.1%')),
+        fill_value=_parse_pct(get('fill_rate', '90.7%')),
+        backorder_count=int(get('backorders', '12'))
+    )
+
+def _card_items(network_data: Dict, keys: Tuple[str, ...]) -> Tuple:
+    """Hashable cache key holding just the fields one card reads"""
+    return tuple((key, network_data[key]) for key in keys if key in network_data)
+
+# Shared card layout: headline value plus four supporting rows
+_CARD_TEMPLATE = """
+<div class="metric-card" style="min-height: 200px;">
+    <div class="card-icon">{icon}</div>
+    <div class="card-label">{label}</div>
+    <div class="card-value" style="font-size: 2.2rem; color: #D90000;">{value}</div>
+    <div class="card-subtitle" style="font-size: 0.85rem; color: #92400E;">{subtitle}</div>
+    <div style="margin-top: 0.8rem; padding-top: 0.8rem; border-top: 1px solid rgba(217, 0, 0, 0.15);">
+        {rows}
+    </div>
+</div>
+"""
+
+# Style attributes shared by every row, interned once at import and spliced
+# into the row template so each row only formats its label, value and color
+_ROW_STYLE = sys.intern("display: flex; justify-content: space-between;")
+_LABEL_STYLE = sys.intern("color: #92400E; font-size: 0.8rem;")
+_VALUE_STYLE = sys.intern("font-weight: 600; font-size: 0.85rem;")
+
+_ROW_TEMPLATE = (
+    f'<div style="{_ROW_STYLE}{{spacing}}">'
+    f'<span style="{_LABEL_STYLE}">{{label}}:</span>'
+    f'<span style="{_VALUE_STYLE} color: {{color}};">{{value}}</span>'
+    '</div>'
+)
+
+_ROW_SPACING = ' margin-bottom: 0.4rem;'
+_VALUE_COLOR = '#7C2D12'
+
+_NETWORK_GRID_TEMPLATE = """### 🚚 Distribution Network Performance
+
+<div class="card-container" style="grid-template-columns: repeat(3, minmax(0, 1fr)); gap: 1rem; margin: 0 0 1rem 0;">
+{total_facilities}
+{active_points}
+{lead_time}
+</div>
+<div class="card-container" style="grid-template-columns: repeat(2, minmax(0, 1fr)); gap: 1rem; margin: 0;">
+{turnover}
+{fill_rate}
+</div>
+"""
+
+# Key challenges: four alert cards in a 2x2 grid, styled by .alert-card
+_CHALLENGES_TEMPLATE = """#### KEY CHALLENGES
+
+<div class="card-container" style="grid-template-columns: repeat(2, minmax(0, 1fr)); gap: 0 1rem; margin: 0;">
+{alerts}
+</div>
+"""
+
+_ALERT_TEMPLATE = (
+    '<div class="alert-card {kind}">'
+    '<div class="alert-icon">{icon}</div>'
+    '<div class="alert-content">{message}</div>'
+    '</div>'
+)
+
+# Rating tables: ascending thresholds, one (label, color) per band.
+# bisect_left puts a value equal to a threshold in the lower band (<= cut-offs),
+# bisect_right puts it in the upper band (>= cut-offs)
+_UTILIZATION_THRESHOLDS = (50, 75)  # > 50 amber, > 75 green
+_UTILIZATION_COLORS = ('#DC2626', '#F59E0B', '#16A34A')
+
+_LEAD_TIME_THRESHOLDS = (2, 3.5, 5)  # <= days
+_LEAD_TIME_RATINGS = (("Excellent", "#16A34A"), ("Good", "#22C55E"), ("Fair", "#F59E0B"), ("Poor", "#DC2626"))
+
+_TURNOVER_THRESHOLDS = (2, 3)  # >= turns per month
+_TURNOVER_RATINGS = (("Low", "#DC2626"), ("Medium", "#F59E0B"), ("High", "#16A34A"))
+
+_FILL_RATE_THRESHOLDS = (85, 90, 95)  # >= percent
+_FILL_RATE_RATINGS = (("Poor", "#DC2626"), ("Fair", "#F59E0B"), ("Good", "#22C55E"), ("Excellent", "#16A34A"))
+
+# Dashboard sample data; read-only so every rerun shares the same objects
+_DEFAULT_NETWORK_DATA = types.MappingProxyType({
+    # Total Facilities
+    'total_facilities': '156',
+    'health_centers': '89',
+    'hospitals': '42',
+    'warehouses': '12',
+    'mobile_units': '13',
+
+    # Active Distribution Points
+    'active_points': '72',
+    'total_points': '94',
+    'urban_points': '28',
+    'rural_points': '44',
+
+    # Lead Time
+    'lead_time': '3.1 days',
+    'target_lead_time': '≤3 days',
+    'min_lead_time': '1.2 days',
+    'max_lead_time': '7.8 days',
+
+    # Turnover Rate
+    'turnover_rate': '3.2x/month',
+    'days_on_hand': '9.4 days',
+    'reorder_point': '14 days',
+    'waste_rate': '2.1%',
+
+    # Fill Rate
+    'fill_rate': '90.7%',
+    'target_fill_rate': '95%',
+    'backorders': '12',
+    'on_time_delivery': '88.3%'
+})
+
+_DEFAULT_SUMMARY_DATA = types.MappingProxyType({
+    'coverage_districts': '130/146',
+    'efficiency_score': '87/100',
+    'monthly_volume': '2,847 MT',
+    'cost_per_mt': 'UGX 1.2M',
+    'challenge_1': 'Remote area access (18 districts)',
+    'challenge_2': 'Cold chain gaps (12 facilities)',
+    'challenge_3': 'Stock-outs in 3 regions',
+    'improvement': 'Fleet expanded by 15%'
+})
+
+# Streamlit 1.33+ reruns a fragment on its own instead of the whole script;
+# older releases (including the pinned 1.28) render the dashboard unchanged
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+def _card_html(icon: str, label: str, value, subtitle: str, rows: List[Tuple]) -> str:
+    """Fill the card template; rows are (label, value, color) tuples"""
+    
+    fill_row = _ROW_TEMPLATE.format_map
+    last = len(rows) - 1
+    rows_html = "".join(
+        fill_row({
+            'spacing': '' if i == last else _ROW_SPACING,
+            'label': row_label, 'value': row_value, 'color': row_color
+        })
+        for i, (row_label, row_value, row_color) in enumerate(rows)
+    )
+    return _CARD_TEMPLATE.format_map({
+        'icon': icon, 'label': label, 'value': value, 'subtitle': subtitle, 'rows': rows_html
+    })
+
+@st.cache_data(max_entries=64, ttl=300, show_spinner=False)
+def _render_total_facilities_card(card_items: Tuple) -> str:
+    """HTML for the Total Facilities card"""
+    
+    get = dict(card_items).get
+    return _card_html("🏥", "Total Facilities", get('total_facilities', '156'), "Distribution network", [
+        ("Health Centers", get('health_centers', '89'), _VALUE_COLOR),
+        ("Hospitals", get('hospitals', '42'), _VALUE_COLOR),
+        ("Warehouses", get('warehouses', '12'), _VALUE_COLOR),
+        ("Mobile Units", get('mobile_units', '13'), _VALUE_COLOR)
+    ])
+
+@st.cache_data(max_entries=64, ttl=300, show_spinner=False)
+def _render_active_points_card(card_items: Tuple, utilization: float) -> str:
+    """HTML for the Active Distribution Points card"""
+    
+    get = dict(card_items).get
+    utilization_color = _UTILIZATION_COLORS[bisect.bisect_left(_UTILIZATION_THRESHOLDS, utilization)]
+    
+    return _card_html("📍", "Active Distribution Points", get('active_points', '72'), "Currently operational", [
+        ("Total Points", get('total_points', '94'), _VALUE_COLOR),
+        ("Utilization", f"{utilization:.1f}%", utilization_color),
+        ("Urban", get('urban_points', '28'), _VALUE_COLOR),
+        ("Rural", get('rural_points', '44'), _VALUE_COLOR)
+    ])
+
+@st.cache_data(max_entries=64, ttl=300, show_spinner=False)
+def _render_lead_time_card(card_items: Tuple, lead_time_value: float) -> str:
+    """HTML for the Average Lead Time card"""
+    
+    get = dict(card_items).get
+    performance, perf_color = _LEAD_TIME_RATINGS[bisect.bisect_left(_LEAD_TIME_THRESHOLDS, lead_time_value)]
+    
+    return _card_html("⏱️", "Average Lead Time", get('lead_time', '3.1 days'), "Order to delivery", [
+        ("Performance", performance, perf_color),
+        ("Target", get('target_lead_time', '≤3 days'), _VALUE_COLOR),
+        ("Min Time", get('min_lead_time', '1.2 days'), _VALUE_COLOR),
+        ("Max Time", get('max_lead_time', '7.8 days'), _VALUE_COLOR)
+    ])
+
+@st.cache_data(max_entries=64, ttl=300, show_spinner=False)
+def _render_turnover_card(card_items: Tuple, turnover_value: float, waste_value: float) -> str:
+    """HTML for the Stock Turnover Rate card"""
+    
+    get = dict(card_items).get
+    efficiency, eff_color = _TURNOVER_RATINGS[bisect.bisect_right(_TURNOVER_THRESHOLDS, turnover_value)]
+    waste_color = '#16A34A' if waste_value < 3.0 else '#F59E0B'
+    
+    return _card_html("🔄", "Stock Turnover Rate", get('turnover_rate', '3.2x/month'), "Inventory efficiency", [
+        ("Efficiency", efficiency, eff_color),
+        ("Days on Hand", get('days_on_hand', '9.4 days'), _VALUE_COLOR),
+        ("Reorder Point", get('reorder_point', '14 days'), _VALUE_COLOR),
+        ("Waste Rate", get('waste_rate', '2.1%'), waste_color)
+    ])
+
+@st.cache_data(max_entries=64, ttl=300, show_spinner=False)
+def _render_fill_rate_card(card_items: Tuple, fill_value: float, backorders: int) -> str:
+    """HTML for the Fill Rate card"""
+    
+    get = dict(card_items).get
+    service_level, service_color = _FILL_RATE_RATINGS[bisect.bisect_right(_FILL_RATE_THRESHOLDS, fill_value)]
+    backorder_color = '#DC2626' if backorders > 20 else '#F59E0B' if backorders > 10 else '#16A34A'
+    
+    return _card_html("📦", "Fill Rate", get('fill_rate', '90.7%'), "Order fulfillment", [
+        ("Service Level", service_level, service_color),
+        ("Target", get('target_fill_rate', '95%'), _VALUE_COLOR),
+        ("Backorders", get('backorders', '12'), backorder_color),
+        ("On-Time", get('on_time_delivery', '88.3%'), _VALUE_COLOR)
+    ])
 
 def create_distribution_network_cards(network_data: Dict) -> None:
     """Create the distribution network metric cards in a grid layout with three-tier information
@@ -17,178 +289,24 @@ def create_distribution_network_cards(network_data: Dict) -> None:
             - Context data for each metric (operational details, performance indicators, etc.)
     """
     
-    # Create responsive grid layout - 3 columns for first row, 2 for second
-    st.markdown("### 🚚 Distribution Network Performance")
+    # Each card is cached on its own fields plus just the derived numbers it
+    # rates, so a change to one metric only re-renders the card showing it
+    derived = _derive(_card_items(network_data, _DERIVED_KEYS))
     
-    # First row - 3 primary metrics
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        # Total Facilities Card
-        st.markdown(f"""
-        <div class="metric-card" style="min-height: 200px;">
-            <div class="card-icon">🏥</div>
-            <div class="card-label">Total Facilities</div>
-            <div class="card-value" style="font-size: 2.2rem; color: #D90000;">{network_data.get('total_facilities', '156')}</div>
-            <div class="card-subtitle" style="font-size: 0.85rem; color: #92400E;">Distribution network</div>
-            <div style="margin-top: 0.8rem; padding-top: 0.8rem; border-top: 1px solid rgba(217, 0, 0, 0.15);">
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.4rem;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Health Centers:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: #7C2D12;">{network_data.get('health_centers', '89')}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.4rem;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Hospitals:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: #7C2D12;">{network_data.get('hospitals', '42')}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.4rem;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Warehouses:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: #7C2D12;">{network_data.get('warehouses', '12')}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Mobile Units:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: #7C2D12;">{network_data.get('mobile_units', '13')}</span>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        # Active Distribution Points Card
-        active_points = network_data.get('active_points', '72')
-        total_points = network_data.get('total_points', '94')
-        utilization = float(active_points) / float(total_points) * 100 if total_points else 0
-        
-        st.markdown(f"""
-        <div class="metric-card" style="min-height: 200px;">
-            <div class="card-icon">📍</div>
-            <div class="card-label">Active Distribution Points</div>
-            <div class="card-value" style="font-size: 2.2rem; color: #D90000;">{active_points}</div>
-            <div class="card-subtitle" style="font-size: 0.85rem; color: #92400E;">Currently operational</div>
-            <div style="margin-top: 0.8rem; padding-top: 0.8rem; border-top: 1px solid rgba(217, 0, 0, 0.15);">
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.4rem;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Total Points:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: #7C2D12;">{total_points}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.4rem;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Utilization:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: {'#16A34A' if utilization > 75 else '#F59E0B' if utilization > 50 else '#DC2626'};">{utilization:.1f}%</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.4rem;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Urban:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: #7C2D12;">{network_data.get('urban_points', '28')}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Rural:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: #7C2D12;">{network_data.get('rural_points', '44')}</span>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        # Average Lead Time Card
-        lead_time = network_data.get('lead_time', '3.1 days')
-        lead_time_value = float(lead_time.split()[0]) if isinstance(lead_time, str) else lead_time
-        performance = "Excellent" if lead_time_value <= 2 else "Good" if lead_time_value <= 3.5 else "Fair" if lead_time_value <= 5 else "Poor"
-        perf_color = "#16A34A" if performance == "Excellent" else "#22C55E" if performance == "Good" else "#F59E0B" if performance == "Fair" else "#DC2626"
-        
-        st.markdown(f"""
-        <div class="metric-card" style="min-height: 200px;">
-            <div class="card-icon">⏱️</div>
-            <div class="card-label">Average Lead Time</div>
-            <div class="card-value" style="font-size: 2.2rem; color: #D90000;">{lead_time}</div>
-            <div class="card-subtitle" style="font-size: 0.85rem; color: #92400E;">Order to delivery</div>
-            <div style="margin-top: 0.8rem; padding-top: 0.8rem; border-top: 1px solid rgba(217, 0, 0, 0.15);">
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.4rem;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Performance:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: {perf_color};">{performance}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.4rem;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Target:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: #7C2D12;">{network_data.get('target_lead_time', '≤3 days')}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.4rem;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Min Time:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: #7C2D12;">{network_data.get('min_lead_time', '1.2 days')}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Max Time:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: #7C2D12;">{network_data.get('max_lead_time', '7.8 days')}</span>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Second row - 2 operational metrics
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Stock Turnover Rate Card
-        turnover = network_data.get('turnover_rate', '3.2x/month')
-        turnover_value = float(turnover.split('x')[0]) if isinstance(turnover, str) and 'x' in turnover else 3.2
-        efficiency = "High" if turnover_value >= 3 else "Medium" if turnover_value >= 2 else "Low"
-        eff_color = "#16A34A" if efficiency == "High" else "#F59E0B" if efficiency == "Medium" else "#DC2626"
-        
-        st.markdown(f"""
-        <div class="metric-card" style="min-height: 200px;">
-            <div class="card-icon">🔄</div>
-            <div class="card-label">Stock Turnover Rate</div>
-            <div class="card-value" style="font-size: 2.2rem; color: #D90000;">{turnover}</div>
-            <div class="card-subtitle" style="font-size: 0.85rem; color: #92400E;">Inventory efficiency</div>
-            <div style="margin-top: 0.8rem; padding-top: 0.8rem; border-top: 1px solid rgba(217, 0, 0, 0.15);">
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.4rem;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Efficiency:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: {eff_color};">{efficiency}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.4rem;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Days on Hand:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: #7C2D12;">{network_data.get('days_on_hand', '9.4 days')}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.4rem;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Reorder Point:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: #7C2D12;">{network_data.get('reorder_point', '14 days')}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Waste Rate:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: {'#16A34A' if network_data.get('waste_rate', '2.1%') < '3%' else '#F59E0B'};">{network_data.get('waste_rate', '2.1%')}</span>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        # Fill Rate Card
-        fill_rate = network_data.get('fill_rate', '90.7%')
-        fill_value = float(fill_rate.rstrip('%')) if isinstance(fill_rate, str) else fill_rate
-        service_level = "Excellent" if fill_value >= 95 else "Good" if fill_value >= 90 else "Fair" if fill_value >= 85 else "Poor"
-        service_color = "#16A34A" if service_level == "Excellent" else "#22C55E" if service_level == "Good" else "#F59E0B" if service_level == "Fair" else "#DC2626"
-        
-        st.markdown(f"""
-        <div class="metric-card" style="min-height: 200px;">
-            <div class="card-icon">📦</div>
-            <div class="card-label">Fill Rate</div>
-            <div class="card-value" style="font-size: 2.2rem; color: #D90000;">{fill_rate}</div>
-            <div class="card-subtitle" style="font-size: 0.85rem; color: #92400E;">Order fulfillment</div>
-            <div style="margin-top: 0.8rem; padding-top: 0.8rem; border-top: 1px solid rgba(217, 0, 0, 0.15);">
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.4rem;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Service Level:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: {service_color};">{service_level}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.4rem;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Target:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: #7C2D12;">{network_data.get('target_fill_rate', '95%')}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; margin-bottom: 0.4rem;">
-                    <span style="color: #92400E; font-size: 0.8rem;">Backorders:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: {'#DC2626' if int(network_data.get('backorders', '12')) > 20 else '#F59E0B' if int(network_data.get('backorders', '12')) > 10 else '#16A34A'};">{network_data.get('backorders', '12')}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between;">
-                    <span style="color: #92400E; font-size: 0.8rem;">On-Time:</span>
-                    <span style="font-weight: 600; font-size: 0.85rem; color: #7C2D12;">{network_data.get('on_time_delivery', '88.3%')}</span>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Create responsive grid layout - 3 columns for first row, 2 for second.
+    # Both rows go out in a single st.markdown call; .card-container stacks
+    # the cards into one column on narrow screens
+    st.markdown(_NETWORK_GRID_TEMPLATE.format_map({
+        # First row - 3 primary metrics
+        'total_facilities': _render_total_facilities_card(_card_items(network_data, _TOTAL_FACILITIES_KEYS)).strip(),
+        'active_points': _render_active_points_card(_card_items(network_data, _ACTIVE_POINTS_KEYS), derived.utilization).strip(),
+        'lead_time': _render_lead_time_card(_card_items(network_data, _LEAD_TIME_KEYS), derived.lead_time_value).strip(),
+        # Second row - 2 operational metrics
+        'turnover': _render_turnover_card(_card_items(network_data, _TURNOVER_KEYS),
+                                          derived.turnover_value, derived.waste_value).strip(),
+        'fill_rate': _render_fill_rate_card(_card_items(network_data, _FILL_RATE_KEYS),
+                                            derived.fill_value, derived.backorder_count).strip()
+    }), unsafe_allow_html=True)
 
 def create_distribution_summary_card(summary_data: Dict) -> None:
     """Create a comprehensive distribution network summary card"""
@@ -206,80 +324,40 @@ def create_distribution_summary_card(summary_data: Dict) -> None:
         st.metric("EFFICIENCY SCORE", summary_data.get('efficiency_score', '87/100'), help="Overall performance")  
         st.metric("COST EFFICIENCY", summary_data.get('cost_per_mt', 'UGX 1.2M'), help="Per metric ton")
     
-    # Key Challenges section
-    st.markdown("#### KEY CHALLENGES")
-    challenge_col1, challenge_col2 = st.columns(2)
-    
-    with challenge_col1:
-        st.warning(f"⚠️ {summary_data.get('challenge_1', 'Remote area access (18 districts)')}")
-        st.error(f"🔴 {summary_data.get('challenge_3', 'Stock-outs in 3 regions')}")
-    
-    with challenge_col2:
-        st.warning(f"⚠️ {summary_data.get('challenge_2', 'Cold chain gaps (12 facilities)')}")
-        st.success(f"✅ {summary_data.get('improvement', 'Fleet expanded by 15%')}")
-    
+    # Key Challenges section - one markdown block instead of a second
+    # column pair and four alert widgets; grid order fills row by row
+    fill_alert = _ALERT_TEMPLATE.format_map
+    st.markdown(_CHALLENGES_TEMPLATE.format_map({'alerts': "\n".join((
+        fill_alert({'kind': 'warning', 'icon': '⚠️',
+                    'message': summary_data.get('challenge_1', 'Remote area access (18 districts)')}),
+        fill_alert({'kind': 'warning', 'icon': '⚠️',
+                    'message': summary_data.get('challenge_2', 'Cold chain gaps (12 facilities)')}),
+        fill_alert({'kind': 'critical', 'icon': '🔴',
+                    'message': summary_data.get('challenge_3', 'Stock-outs in 3 regions')}),
+        fill_alert({'kind': 'success', 'icon': '✅',
+                    'message': summary_data.get('improvement', 'Fleet expanded by 15%')})
+    ))}), unsafe_allow_html=True)
 
+@_fragment
 def render_distribution_dashboard():
     """Render the complete distribution network dashboard with enhanced cards"""
     
-    # Main metrics with full context
-    network_data = {
-        # Total Facilities
-        'total_facilities': '156',
-        'health_centers': '89',
-        'hospitals': '42',
-        'warehouses': '12',
-        'mobile_units': '13',
-        
-        # Active Distribution Points
-        'active_points': '72',
-        'total_points': '94',
-        'urban_points': '28',
-        'rural_points': '44',
-        
-        # Lead Time
-        'lead_time': '3.1 days',
-        'target_lead_time': '≤3 days',
-        'min_lead_time': '1.2 days',
-        'max_lead_time': '7.8 days',
-        
-        # Turnover Rate
-        'turnover_rate': '3.2x/month',
-        'days_on_hand': '9.4 days',
-        'reorder_point': '14 days',
-        'waste_rate': '2.1%',
-        
-        # Fill Rate
-        'fill_rate': '90.7%',
-        'target_fill_rate': '95%',
-        'backorders': '12',
-        'on_time_delivery': '88.3%'
-    }
-    
     # Create the enhanced distribution cards
-    create_distribution_network_cards(network_data)
+    create_distribution_network_cards(_DEFAULT_NETWORK_DATA)
     
     # Add summary card
     st.markdown("---")
-    summary_data = {
-        'coverage_districts': '130/146',
-        'efficiency_score': '87/100',
-        'monthly_volume': '2,847 MT',
-        'cost_per_mt': 'UGX 1.2M',
-        'challenge_1': 'Remote area access (18 districts)',
-        'challenge_2': 'Cold chain gaps (12 facilities)',
-        'challenge_3': 'Stock-outs in 3 regions',
-        'improvement': 'Fleet expanded by 15%'
-    }
-    create_distribution_summary_card(summary_data)
+    create_distribution_summary_card(_DEFAULT_SUMMARY_DATA)
 
 if __name__ == "__main__":
     # Test the distribution network cards
     st.set_page_config(layout="wide", page_title="Distribution Network Dashboard")
     
-    # Apply the card styling from the main components
-    from uganda_card_components import apply_card_styling
-    apply_card_styling()
+    # Apply the card styling from the main components. It is re-emitted on
+    # every rerun: Streamlit drops elements a rerun does not redraw, so a
+    # session-state "already applied" flag would leave later reruns unstyled
+    if CARD_STYLING_AVAILABLE:
+        apply_card_styling()
     
     st.title("🚚 Uganda Nutrition - Distribution Network Dashboard")
     st.markdown("---")
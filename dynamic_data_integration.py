@@ -3,17 +3,204 @@ Integration module to replace hardcoded values with dynamic data
 This connects the configuration system to the main application
 """
 
+import bisect
+import functools
+import threading
+import time
 import numpy as np
 import pandas as pd
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from uganda_nutrition_config import get_config
 import streamlit as st
 
+# One configuration object shared by every provider
+_CONFIG = get_config()
+
+# Shared generator for the simulated jitter in descriptions and the live feed
+_RNG = np.random.default_rng()
+
+# Months until each intervention reaches its target population
+_REACH_TIMES = {
+    'fortification': 6,
+    'supplementation': 3,
+    'education': 12,
+    'biofortification': 18
+}
+
+# Program phase by days since program start: < 90 pilot, < 365 implementation,
+# < 730 scale-up, then mature (bisect_right keeps each bound in the later phase)
+_PHASE_BOUNDS = (90, 365, 730)
+_PHASES = ('pilot', 'implementation', 'scale_up', 'mature')
+
+# Share of the potential coverage reached in each program phase
+_PHASE_MULTIPLIERS = {
+    'planning': 0.0,
+    'pilot': 0.3,
+    'implementation': 0.6,
+    'scale_up': 0.8,
+    'mature': 0.9
+}
+
+_BASE_COVERAGE = {
+    'fortification': 0.85,
+    'supplementation': 0.70,
+    'education': 0.90,
+    'biofortification': 0.75
+}
+
+_DESCRIPTIONS = {
+    'fortification': """
+                **What it is:** Adding essential nutrients to commonly consumed foods.
+                
+                **Coverage:** Reaches {coverage:.0%} of population through regular food consumption
+                **Cost-effectiveness:** ${cost:.2f} per person per year
+                **Impact timeline:** {timeline} months to measurable impact
+                
+                **Success factors:**
+                • Government mandate and enforcement
+                • Industry compliance monitoring
+                • Consumer awareness campaigns
+            """,
+    'supplementation': """
+                **What it is:** Direct provision of nutrient supplements to at-risk populations.
+                
+                **Target efficiency:** {effectiveness:.0%} reduction in deficiency
+                **Delivery mechanism:** Health facilities and community workers
+                **Compliance rate:** {compliance:.0%} with proper monitoring
+                
+                **Critical requirements:**
+                • Cold chain for certain supplements
+                • Regular distribution schedule
+                • Beneficiary tracking system
+            """,
+    'education': """
+                **What it is:** Community-based nutrition education and behavior change.
+                
+                **Sustainability:** Long-term behavior change
+                **Cost efficiency:** ${cost:.2f} per person
+                **Reach:** {coverage:.0%} of communities
+                
+                **Key components:**
+                • Cooking demonstrations
+                • Kitchen gardens
+                • WASH integration
+            """,
+    'biofortification': """
+                **What it is:** Nutrient-rich crop varieties through breeding.
+                
+                **Adoption rate:** {adoption:.0%} of farmers after 2 years
+                **Yield impact:** Minimal to positive
+                **Sustainability:** Self-sustaining after adoption
+                
+                **Available crops:**
+                • Orange sweet potato (Vitamin A)
+                • High-iron beans
+                • Zinc maize
+            """
+}
+
+# Simulated rate shown by some description templates: (field, centre, +/- spread)
+_DESCRIPTION_JITTER = {
+    'supplementation': ('compliance', 0.70, 0.05),
+    'biofortification': ('adoption', 0.60, 0.10)
+}
+
+_POLICY_REQUIREMENTS = {
+    'fortification': (
+        "Mandatory fortification legislation",
+        "Quality standards (UNBS certification)",
+        "Industry compliance monitoring framework",
+        "Import regulations for premix"
+    ),
+    'supplementation': (
+        "National supplementation protocol",
+        "Integration with child health days",
+        "Supply chain management system",
+        "Healthcare worker training program"
+    ),
+    'education': (
+        "Behavior change communication strategy",
+        "Community health worker deployment",
+        "School curriculum integration",
+        "Media campaign authorization"
+    ),
+    'biofortification': (
+        "Seed certification standards",
+        "Agricultural extension integration",
+        "Farmer subsidy program",
+        "Market linkage support"
+    )
+}
+
+# Health outcome reductions per unit of mix effectiveness and their caps:
+# mortality (more conservative, max 25%), stunting (gradual, max 30%),
+# anemia (max 40%)
+_OUTCOME_REDUCTION_FACTORS = np.array([0.20, 0.25, 0.35])
+_OUTCOME_REDUCTION_CAPS = np.array([0.25, 0.30, 0.40])
+
+# KPI targets for display: (label, config key, format spec)
+_KPI_SPECS = (
+    ('Coverage Rate', 'coverage_rate', '{:.0%}'),
+    ('Supplement Compliance', 'compliance_rate', '{:.0%}'),
+    ('Fortification Standards Met', 'fortification_standards', '{:.0%}'),
+    ('Stock-out Rate', 'stock_out_rate', '<{:.0%}'),
+    ('Cost per Beneficiary', 'cost_per_beneficiary', '<${:.0f}'),
+    ('Stunting Reduction Rate', 'stunting_reduction', '{:.0%}'),
+    ('Anemia Reduction', 'anemia_reduction', '{:.0%}'),
+    ('B12 Deficiency Reduction', 'b12_deficiency_reduction', '{:.0%}')
+)
+
+_SCENARIO_COLORS = {'best_case': 'green', 'expected_case': 'blue', 'worst_case': 'red'}
+
+# Live data feed rows
+_LIVE_FEED_METRICS = ('New Beneficiaries', 'Supplements Distributed', 'Districts Active', 'Staff Deployed')
+_LIVE_FEED_STATUSES = ('Active', 'Normal', 'Operational', 'Deployed')
+
+# Success metrics table: lower bound of each indicator's current value and
+# how it is displayed (stunting, anemia, B12, coverage, cost per person)
+_SUCCESS_METRIC_FLOORS = (20, 15, 20, 0, 15)
+_SUCCESS_METRIC_FORMATS = ('{:.0f}%', '{:.0f}%', '{:.0f}% deficient', '{:.0f}%', '${:.0f}/person')
+
+# Progress labels by remaining gap to target: < 30% good, < 60% on track,
+# otherwise behind (searchsorted side='right' puts each bound in the later band)
+_PROGRESS_THRESHOLDS = np.array([30.0, 60.0])
+_PROGRESS_LABELS = ('🟢 Good', '🟡 On track', '🔴 Behind')
+
+# Timestamp shared by every call within the same second (see _now)
+_now_cache = (None, None)
+
+def _now() -> pd.Timestamp:
+    """Current time, reused by every caller within the same monotonic second
+    
+    One rerun calls this from several metrics; second granularity is far
+    finer than the day/year resolution they use.
+    """
+    global _now_cache
+    tick = int(time.monotonic())
+    cached_tick, now = _now_cache
+    if cached_tick != tick:
+        now = pd.Timestamp.now()
+        _now_cache = (tick, now)
+    return now
+
 class DynamicDataProvider:
     """Provides dynamic data to replace hardcoded values in the main application"""
     
+    __slots__ = ('config', '_get_intervention_costs', '_mix_matrices', '_population_constants',
+                 '_success_table_memo')
+    
     def __init__(self):
-        self.config = get_config()
+        self.config = _CONFIG
+        # Costs depend only on the intervention type and the (static) config,
+        # so each type is computed once per provider
+        self._get_intervention_costs = functools.lru_cache(maxsize=16)(self.config.get_intervention_costs)
+        # Cost/effectiveness matrices per intervention mix layout (see _get_mix_matrix)
+        self._mix_matrices = {}
+        # Five integer products of static config values: derive them once here
+        self._population_constants = self._compute_population_constants()
+        # (year, table) of the last success metrics table built; the config is
+        # static, so the table only changes when the year rolls over
+        self._success_table_memo = (None, None)
         self.initialize_session_data()
     
     def initialize_session_data(self):
@@ -26,6 +213,11 @@ class DynamicDataProvider:
     
     def get_population_constants(self) -> Dict[str, int]:
         """Replace hardcoded population constants"""
+        # Copy, so callers may modify the result
+        return dict(self._population_constants)
+    
+    def _compute_population_constants(self) -> Dict[str, int]:
+        """Derive the population constants from the config"""
         pop = self.config.get_population_estimate()
         age_dist = self.config.get_age_distribution()
         stunting_rate = self.config.get_stunting_rate()
@@ -41,18 +233,23 @@ class DynamicDataProvider:
     def get_intervention_details(self) -> Dict[str, Dict[str, Any]]:
         """Get dynamic intervention details"""
         interventions = {}
+        phase = st.session_state.get('program_phase', 'planning')
+        phase_mult = _PHASE_MULTIPLIERS.get(phase, 0.5)
         
         for intervention_type in ['fortification', 'supplementation', 'education', 'biofortification']:
-            cost_data = self.config.get_intervention_costs(intervention_type)
+            cost_data = self._get_intervention_costs(intervention_type)
+            reach_time = _REACH_TIMES[intervention_type]
+            base = _BASE_COVERAGE[intervention_type]
+            coverage = min(base * phase_mult, base)
             
             # Map to expected format
             interventions[intervention_type] = {
                 'name': intervention_type.title().replace('_', ' '),
                 'unit_cost': cost_data['unit_cost'],
                 'effectiveness': cost_data['effectiveness'],
-                'reach_time': self._get_reach_time(intervention_type),
-                'coverage_potential': self._get_coverage_potential(intervention_type),
-                'description': self._get_intervention_description(intervention_type),
+                'reach_time': reach_time,
+                'coverage_potential': coverage,
+                'description': self._get_intervention_description(intervention_type, cost_data, coverage, reach_time),
                 'policy_requirements': self._get_policy_requirements(intervention_type)
             }
         
@@ -60,132 +257,63 @@ class DynamicDataProvider:
     
     def _get_reach_time(self, intervention_type: str) -> int:
         """Get realistic reach times in months"""
-        reach_times = {
-            'fortification': 6,
-            'supplementation': 3,
-            'education': 12,
-            'biofortification': 18
-        }
-        return reach_times.get(intervention_type, 9)
+        return _REACH_TIMES.get(intervention_type, 9)
     
     def _get_coverage_potential(self, intervention_type: str) -> float:
         """Get realistic coverage potential"""
         # Based on program phase and intervention type
         phase = st.session_state.get('program_phase', 'planning')
-        phase_multipliers = {
-            'planning': 0.0,
-            'pilot': 0.3,
-            'implementation': 0.6,
-            'scale_up': 0.8,
-            'mature': 0.9
-        }
-        
-        base_coverage = {
-            'fortification': 0.85,
-            'supplementation': 0.70,
-            'education': 0.90,
-            'biofortification': 0.75
-        }
-        
-        phase_mult = phase_multipliers.get(phase, 0.5)
-        base = base_coverage.get(intervention_type, 0.75)
+        phase_mult = _PHASE_MULTIPLIERS.get(phase, 0.5)
+        base = _BASE_COVERAGE.get(intervention_type, 0.75)
         
         return min(base * phase_mult, base)
     
-    def _get_intervention_description(self, intervention_type: str) -> str:
-        """Get detailed intervention descriptions"""
-        descriptions = {
-            'fortification': """
-                **What it is:** Adding essential nutrients to commonly consumed foods.
-                
-                **Coverage:** Reaches {coverage:.0%} of population through regular food consumption
-                **Cost-effectiveness:** ${cost:.2f} per person per year
-                **Impact timeline:** {timeline} months to measurable impact
-                
-                **Success factors:**
-                • Government mandate and enforcement
-                • Industry compliance monitoring
-                • Consumer awareness campaigns
-            """,
-            'supplementation': """
-                **What it is:** Direct provision of nutrient supplements to at-risk populations.
-                
-                **Target efficiency:** {effectiveness:.0%} reduction in deficiency
-                **Delivery mechanism:** Health facilities and community workers
-                **Compliance rate:** {compliance:.0%} with proper monitoring
-                
-                **Critical requirements:**
-                • Cold chain for certain supplements
-                • Regular distribution schedule
-                • Beneficiary tracking system
-            """,
-            'education': """
-                **What it is:** Community-based nutrition education and behavior change.
-                
-                **Sustainability:** Long-term behavior change
-                **Cost efficiency:** ${cost:.2f} per person
-                **Reach:** {coverage:.0%} of communities
-                
-                **Key components:**
-                • Cooking demonstrations
-                • Kitchen gardens
-                • WASH integration
-            """,
-            'biofortification': """
-                **What it is:** Nutrient-rich crop varieties through breeding.
-                
-                **Adoption rate:** {adoption:.0%} of farmers after 2 years
-                **Yield impact:** Minimal to positive
-                **Sustainability:** Self-sustaining after adoption
-                
-                **Available crops:**
-                • Orange sweet potato (Vitamin A)
-                • High-iron beans
-                • Zinc maize
-            """
+    def _get_intervention_description(self, intervention_type: str,
+                                      cost_data: Optional[Dict[str, Any]] = None,
+                                      coverage: Optional[float] = None,
+                                      reach_time: Optional[int] = None) -> str:
+        """Get detailed intervention descriptions
+        
+        cost_data, coverage and reach_time are looked up when not supplied;
+        get_intervention_details passes the values it already has.
+        """
+        desc_template = _DESCRIPTIONS.get(intervention_type, "Standard intervention")
+        if cost_data is None:
+            cost_data = self._get_intervention_costs(intervention_type)
+        if coverage is None:
+            coverage = self._get_coverage_potential(intervention_type)
+        if reach_time is None:
+            reach_time = self._get_reach_time(intervention_type)
+        
+        fields = {
+            'coverage': coverage,
+            'cost': cost_data['unit_cost'],
+            'effectiveness': cost_data['effectiveness'],
+            'timeline': reach_time
         }
+        # Only templates that show a simulated rate pay for a random draw
+        jitter = _DESCRIPTION_JITTER.get(intervention_type)
+        if jitter is not None:
+            field, centre, spread = jitter
+            fields[field] = centre + _RNG.uniform(-spread, spread)
         
-        desc_template = descriptions.get(intervention_type, "Standard intervention")
-        cost_data = self.config.get_intervention_costs(intervention_type)
-        
-        return desc_template.format(
-            coverage=self._get_coverage_potential(intervention_type),
-            cost=cost_data['unit_cost'],
-            effectiveness=cost_data['effectiveness'],
-            timeline=self._get_reach_time(intervention_type),
-            compliance=0.70 + np.random.uniform(-0.05, 0.05),
-            adoption=0.60 + np.random.uniform(-0.10, 0.10)
-        )
+        return desc_template.format_map(fields)
     
     def _get_policy_requirements(self, intervention_type: str) -> List[str]:
         """Get policy requirements for each intervention"""
-        requirements = {
-            'fortification': [
-                "Mandatory fortification legislation",
-                "Quality standards (UNBS certification)",
-                "Industry compliance monitoring framework",
-                "Import regulations for premix"
-            ],
-            'supplementation': [
-                "National supplementation protocol",
-                "Integration with child health days",
-                "Supply chain management system",
-                "Healthcare worker training program"
-            ],
-            'education': [
-                "Behavior change communication strategy",
-                "Community health worker deployment",
-                "School curriculum integration",
-                "Media campaign authorization"
-            ],
-            'biofortification': [
-                "Seed certification standards",
-                "Agricultural extension integration",
-                "Farmer subsidy program",
-                "Market linkage support"
-            ]
-        }
-        return requirements.get(intervention_type, ["Standard requirements"])
+        return list(_POLICY_REQUIREMENTS.get(intervention_type, ("Standard requirements",)))
+    
+    def _get_mix_matrix(self, interventions: tuple) -> np.ndarray:
+        """2 x n matrix of unit costs (row 0) and effectiveness (row 1), one column per mix key"""
+        matrix = self._mix_matrices.get(interventions)
+        if matrix is None:
+            cost_data = [self._get_intervention_costs(intervention) for intervention in interventions]
+            matrix = np.array([
+                [data['unit_cost'] for data in cost_data],
+                [data['effectiveness'] for data in cost_data]
+            ], dtype=np.float64).reshape(2, len(interventions))
+            self._mix_matrices[interventions] = matrix
+        return matrix
     
     def calculate_health_outcomes(self, budget: float, population: int, 
                                  intervention_mix: Dict[str, float],
@@ -196,15 +324,13 @@ class DynamicDataProvider:
         impact_multipliers = self.config.get_health_impact_multipliers()
         health_indicators = self.config.baseline_data['health_indicators']
         
-        # Calculate coverage based on budget and intervention mix
-        total_cost = 0
-        total_effectiveness = 0
-        
-        for intervention, percentage in intervention_mix.items():
-            if percentage > 0:
-                cost_data = self.config.get_intervention_costs(intervention)
-                total_cost += (percentage / 100) * cost_data['unit_cost']
-                total_effectiveness += (percentage / 100) * cost_data['effectiveness']
+        # Calculate coverage based on budget and intervention mix: the
+        # mix-weighted unit cost and effectiveness come from one fused
+        # multiply-reduce. Interventions with a non-positive share don't contribute
+        pcts = np.fromiter(intervention_mix.values(), dtype=np.float64, count=len(intervention_mix))
+        np.maximum(pcts, 0, out=pcts)
+        weighted = np.einsum('i,ji->j', pcts, self._get_mix_matrix(tuple(intervention_mix))) / 100
+        total_cost, total_effectiveness = weighted.tolist()
         
         # Realistic coverage calculation
         if total_cost > 0:
@@ -219,25 +345,17 @@ class DynamicDataProvider:
         total_effectiveness *= synergy_factor
         
         # Calculate realistic health impacts
-        pop_constants = self.get_population_constants()
-        
-        # Lives saved calculation (more conservative)
-        u5_mortality = self.config.get_u5_mortality()
-        baseline_deaths = int(pop_constants['CHILDREN_UNDER_5'] * (u5_mortality / 1000))
-        mortality_reduction = min(0.25, total_effectiveness * 0.20)  # Max 25% reduction
-        lives_saved = int(coverage * baseline_deaths * mortality_reduction)
-        
-        # Stunting prevention (gradual impact)
-        stunting_rate = health_indicators['stunting_rate']
-        stunted_children = int(pop_constants['CHILDREN_UNDER_5'] * stunting_rate)
-        stunting_reduction = min(0.30, total_effectiveness * 0.25)  # Max 30% reduction
-        stunting_prevented = int(coverage * stunted_children * stunting_reduction)
-        
-        # Anemia reduction
-        anemia_rates = self.config.get_anemia_prevalence()
-        anemia_baseline = int(pop_constants['CHILDREN_UNDER_5'] * anemia_rates['children_under_5'])
-        anemia_reduction = min(0.40, total_effectiveness * 0.35)  # Max 40% reduction
-        anemia_reduced = int(coverage * anemia_baseline * anemia_reduction)
+        children_under_5 = self.get_population_constants()['CHILDREN_UNDER_5']
+        
+        # Baseline under-5 burden for lives saved (deaths), stunting prevention
+        # and anemia reduction, truncated to whole children like int()
+        baselines = np.array([
+            children_under_5 * (self.config.get_u5_mortality() / 1000),
+            children_under_5 * health_indicators['stunting_rate'],
+            children_under_5 * self.config.get_anemia_prevalence()['children_under_5']
+        ]).astype(np.int64)
+        reductions = np.minimum(_OUTCOME_REDUCTION_CAPS, total_effectiveness * _OUTCOME_REDUCTION_FACTORS)
+        lives_saved, stunting_prevented, anemia_reduced = (coverage * baselines * reductions).astype(np.int64).tolist()
         
         # Economic benefits
         healthcare_savings = coverage * population * total_effectiveness * impact_multipliers['healthcare_cost_saved_per_beneficiary']
@@ -273,17 +391,12 @@ class DynamicDataProvider:
                               time_period: str) -> Dict[str, Any]:
         """Get realistic monitoring metrics based on program maturity"""
         
-        # Determine program phase based on time
-        if hasattr(st.session_state, 'program_start_date'):
-            days_elapsed = (pd.Timestamp.now() - st.session_state.program_start_date).days
-            if days_elapsed < 90:
-                phase = 'pilot'
-            elif days_elapsed < 365:
-                phase = 'implementation'
-            elif days_elapsed < 730:
-                phase = 'scale_up'
-            else:
-                phase = 'mature'
+        # Determine program phase based on time. The provider is shared across
+        # sessions, so a session may not have a start date yet
+        program_start_date = st.session_state.get('program_start_date')
+        if program_start_date is not None:
+            days_elapsed = (_now() - program_start_date).days
+            phase = _PHASES[bisect.bisect_right(_PHASE_BOUNDS, days_elapsed)]
         else:
             phase = 'implementation'
         
@@ -297,23 +410,14 @@ class DynamicDataProvider:
         """Get dynamic KPI targets"""
         # Calculate based on program duration
         if hasattr(st.session_state, 'program_start_date'):
-            years = (pd.Timestamp.now() - st.session_state.program_start_date).days / 365
+            years = (_now() - st.session_state.program_start_date).days / 365
         else:
             years = 1
         
         targets = self.config.get_kpi_targets(int(years))
         
         # Format for display
-        return {
-            'Coverage Rate': f"{targets['coverage_rate']*100:.0f}%",
-            'Supplement Compliance': f"{targets['compliance_rate']*100:.0f}%",
-            'Fortification Standards Met': f"{targets['fortification_standards']*100:.0f}%",
-            'Stock-out Rate': f"<{targets['stock_out_rate']*100:.0f}%",
-            'Cost per Beneficiary': f"<${targets['cost_per_beneficiary']:.0f}",
-            'Stunting Reduction Rate': f"{targets['stunting_reduction']*100:.0f}%",
-            'Anemia Reduction': f"{targets['anemia_reduction']*100:.0f}%",
-            'B12 Deficiency Reduction': f"{targets['b12_deficiency_reduction']*100:.0f}%"
-        }
+        return {label: spec.format(targets[key]) for label, key, spec in _KPI_SPECS}
     
     def get_financial_projections(self, base_budget: float, years: int = 5) -> Dict[str, Any]:
         """Get realistic financial projections"""
@@ -324,17 +428,16 @@ class DynamicDataProvider:
         scenarios = self.config.get_scenario_probabilities()
         
         # Format for display
-        formatted = {}
-        for scenario_name, params in scenarios.items():
-            formatted[scenario_name.replace('_', ' ').title()] = {
+        return {
+            scenario_name.replace('_', ' ').title(): {
                 'probability': params['probability'],
                 'impact': params['impact_multiplier'],
                 'cost': params['cost_multiplier'],
                 'timeline': params['timeline_multiplier'],
-                'color': {'best_case': 'green', 'expected_case': 'blue', 'worst_case': 'red'}[scenario_name]
+                'color': _SCENARIO_COLORS[scenario_name]
             }
-        
-        return formatted
+            for scenario_name, params in scenarios.items()
+        }
     
     def get_gauge_values(self) -> Dict[str, float]:
         """Get current gauge values based on actual metrics"""
@@ -349,8 +452,17 @@ class DynamicDataProvider:
     
     def get_success_metrics_table(self) -> pd.DataFrame:
         """Get success metrics with realistic baselines and targets"""
+        current_year = _now().year
+        memo_year, table = self._success_table_memo
+        if memo_year != current_year:
+            table = self._build_success_metrics_table(current_year)
+            self._success_table_memo = (current_year, table)
+        # Copy, so callers may modify the table they get back
+        return table.copy()
+    
+    def _build_success_metrics_table(self, current_year: int) -> pd.DataFrame:
+        """Build the success metrics table for the given calendar year"""
         
-        current_year = pd.Timestamp.now().year
         baseline_year = 2020
         target_year = 2025
         
@@ -366,43 +478,42 @@ class DynamicDataProvider:
         stunting_current = max(20, stunting_baseline - (stunting_annual_reduction * years_passed))
         stunting_target = max(15, stunting_current - (stunting_annual_reduction * years_to_target))
         
-        # Similar calculations for other indicators
+        # Similar trajectories for the other indicators, clamped once to their
+        # floors (coverage also caps at 60%); the same values feed the
+        # "Current" column and the progress indicators
+        current_values = np.array([
+            stunting_current,
+            28 - years_passed * 1.0,
+            37 - years_passed * 1.5,
+            years_passed * 12,
+            25 - years_passed * 1.5
+        ], dtype=np.float64)
+        np.maximum(current_values, _SUCCESS_METRIC_FLOORS, out=current_values)
+        current_values[3] = min(current_values[3], 60)
+        
         metrics_data = {
             'Indicator': ['Stunting Reduction', 'Anemia Reduction', 'B12 Improvement', 'Coverage Achieved', 'Cost Efficiency'],
             'Baseline (2020)': [f'{stunting_baseline:.0f}%', '28%', '37% deficient', '0%', 'N/A'],
             'Current ({})'.format(current_year): [
-                f'{stunting_current:.0f}%',
-                f'{max(15, 28 - years_passed * 1.0):.0f}%',
-                f'{max(20, 37 - years_passed * 1.5):.0f}% deficient',
-                f'{min(60, years_passed * 12):.0f}%',
-                f'${max(15, 25 - years_passed * 1.5):.0f}/person'
+                fmt.format(value) for fmt, value in zip(_SUCCESS_METRIC_FORMATS, current_values)
             ],
             'Target (2025)': [f'{stunting_target:.0f}%', '15%', '20% deficient', '80%', '$15/person'],
             'Progress': self._calculate_progress_indicators(
-                [stunting_current, 28 - years_passed * 1.0, 37 - years_passed * 1.5, 
-                 years_passed * 12, 25 - years_passed * 1.5],
-                [stunting_target, 15, 20, 80, 15]
+                current_values,
+                np.array([stunting_target, 15, 20, 80, 15], dtype=np.float64)
             )
         }
         
         return pd.DataFrame(metrics_data)
     
-    def _calculate_progress_indicators(self, current_values: List[float], 
-                                      target_values: List[float]) -> List[str]:
+    def _calculate_progress_indicators(self, current_values: Union[List[float], np.ndarray], 
+                                      target_values: Union[List[float], np.ndarray]) -> List[str]:
         """Calculate progress indicators for metrics"""
-        progress = []
-        for current, target in zip(current_values, target_values):
-            if isinstance(current, (int, float)) and isinstance(target, (int, float)):
-                achievement = (target - current) / max(abs(target), 1) * 100
-                if achievement < 30:
-                    progress.append('🟢 Good')
-                elif achievement < 60:
-                    progress.append('🟡 On track')
-                else:
-                    progress.append('🔴 Behind')
-            else:
-                progress.append('🟡 On track')
-        return progress
+        current = np.asarray(current_values, dtype=np.float64)
+        target = np.asarray(target_values, dtype=np.float64)
+        achievement = (target - current) / np.maximum(np.abs(target), 1.0) * 100
+        buckets = np.searchsorted(_PROGRESS_THRESHOLDS, achievement, side='right')
+        return [_PROGRESS_LABELS[bucket] for bucket in buckets]
     
     def get_live_data_feed(self) -> pd.DataFrame:
         """Generate realistic live data feed"""
@@ -415,27 +526,34 @@ class DynamicDataProvider:
         pop_constants = self.get_population_constants()
         daily_reach = int(pop_constants['UGANDA_POPULATION'] * coverage / 365)
         
+        # One batched draw (upper bounds exclusive): new beneficiaries, supplements
+        # (several per person), active districts, staff on duty
+        values = _RNG.integers(
+            [int(daily_reach * 0.8), int(daily_reach * 3), 40, 100],
+            [int(daily_reach * 1.2), int(daily_reach * 5), 80, 300],
+            dtype=np.int64
+        )
+        
         return pd.DataFrame({
-            'Metric': ['New Beneficiaries', 'Supplements Distributed', 'Districts Active', 'Staff Deployed'],
-            'Value': [
-                np.random.randint(int(daily_reach * 0.8), int(daily_reach * 1.2)),
-                np.random.randint(int(daily_reach * 3), int(daily_reach * 5)),  # Multiple supplements per person
-                np.random.randint(40, 80),  # Active districts
-                np.random.randint(100, 300)  # Staff on duty
-            ],
-            'Status': ['Active', 'Normal', 'Operational', 'Deployed']
+            'Metric': _LIVE_FEED_METRICS,
+            'Value': values,
+            'Status': _LIVE_FEED_STATUSES
         })
     
     def get_district_data(self, district_name: str) -> Dict[str, Any]:
         """Get district-specific dynamic data"""
         return self.config.get_district_specific_data(district_name)
 
-# Singleton instance
+# Singleton instance; Streamlit serves sessions from several threads, so
+# creation is guarded by a lock (double-checked to keep the fast path lock-free)
 _provider_instance = None
+_provider_lock = threading.Lock()
 
 def get_data_provider() -> DynamicDataProvider:
     """Get or create the data provider instance"""
     global _provider_instance
     if _provider_instance is None:
-        _provider_instance = DynamicDataProvider()
+        with _provider_lock:
+            if _provider_instance is None:
+                _provider_instance = DynamicDataProvider()
     return _provider_instance
\ No newline at end of file
@@ -6,9 +6,9 @@ Interactive GUI for modeling intervention strategies and outcomes
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
+from types import MappingProxyType, SimpleNamespace
+from typing import NamedTuple
 
 # Page configuration
 st.set_page_config(
@@ -48,6 +48,12 @@ st.markdown("""
 # Initialize session state
 if 'simulation_run' not in st.session_state:
     st.session_state.simulation_run = False
+if 'seed' not in st.session_state:
+    st.session_state.seed = np.random.SeedSequence().entropy
+
+# Per-session generator: the simulated risk scores stay put across reruns
+# and a session can be replayed by setting st.session_state.seed
+RNG = np.random.default_rng(st.session_state.seed)
 
 # Title and description
 st.title("🧂 Kenya Iodine Intervention Simulator")
@@ -65,36 +71,83 @@ CHILDREN_UNDER_5 = int(KENYA_POPULATION * 0.14)  # ~14% are under 5
 PREGNANT_WOMEN = int(KENYA_POPULATION * 0.034)  # ~3.4% pregnant women annually
 RURAL_POPULATION = int(KENYA_POPULATION * 0.73)  # 73% rural
 
+# Allocation editor rows and their default budget split, in INTERVENTION_NAMES order
+ALLOCATION_LABELS = ("🧂 Salt Iodization Program", "🛢️ Oil Fortification", "💊 Direct Supplementation", "🏫 School Feeding Programs")
+DEFAULT_ALLOCATION = (40, 20, 25, 15)
+
+INTERVENTION_NAMES = ('Salt Iodization', 'Oil Fortification', 'Direct Supplements', 'School Programs')
+# Scenario comparison: each scenario scales the current plan's coverage,
+# ROI and IQ gain; Maximum Coverage pins coverage at 95% via the offset
+SCENARIO_NAMES = ("Current Plan", "Maximum Coverage", "Cost-Optimized", "Emergency Response")
+SCENARIO_METRICS = ("Coverage", "ROI", "IQ Gain")
+SCENARIO_MULT = np.array([
+    [1.0, 1.0, 1.0],
+    [0.0, 0.8, 1.2],
+    [0.7, 1.5, 0.8],
+    [1.1, 0.6, 1.3]
+])
+SCENARIO_OFFSET = np.array([
+    [0.0, 0.0, 0.0],
+    [95.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0]
+])
+
+# Pie slice colors (Plotly's qualitative Set3), in INTERVENTION_NAMES order
+INTERVENTION_COLORS = ('rgb(141,211,199)', 'rgb(255,255,179)', 'rgb(190,186,218)', 'rgb(251,128,114)')
+# Population each intervention draws from, in INTERVENTION_NAMES order
+TARGET_POPULATIONS = np.array([AFFECTED_POPULATION] * 3 + [CHILDREN_UNDER_5], dtype=np.float64)
+
+# Simulated risk factor scores are drawn uniformly between these bounds
+RISK_FACTORS = ("Supply Chain", "Quality Control", "Community Adoption", "Political Stability")
+RISK_LOWS = np.array([0.2, 0.3, 0.4, 0.5])
+RISK_HIGHS = np.array([0.8, 0.9, 0.95, 0.9])
+
+class InterventionCost(NamedTuple):
+    """Unit cost, effectiveness and reach time of one intervention"""
+    unit_cost: float
+    effectiveness: float
+    reach_time: int  # months
+
+
+# Built once at import; read-only so callers can't mutate the shared table
+COSTS = MappingProxyType({
+    'salt_iodization': InterventionCost(2.5, 0.85, 6),  # KSH per person per year
+    'oil_fortification': InterventionCost(15, 0.92, 3),  # KSH per person per 6 months
+    'direct_supplement': InterventionCost(50, 0.98, 1),  # KSH per person per year
+    'school_program': InterventionCost(8, 0.88, 2),  # KSH per child per year
+})
+
+def normalize_allocation(weights, min_allocation):
+    """Whole-percent shares summing to 100, each at least min_allocation
+    
+    Every active intervention is first given min_allocation; the rest of the
+    budget is split in proportion to each weight's excess over that minimum,
+    so an allocation that already meets both rules comes back unchanged.
+    Leftover percentage points from rounding go to the largest fractions.
+    """
+    excess = np.clip(np.nan_to_num(np.asarray(weights, dtype=np.float64)) - min_allocation, 0, None)
+    if excess.sum() == 0:
+        excess[:] = 1
+    
+    exact = excess / excess.sum() * (100 - min_allocation * excess.size)
+    extra = np.floor(exact).astype(int)
+    leftover = 100 - min_allocation * excess.size - extra.sum()
+    extra[np.argsort(extra - exact, kind='stable')[:leftover]] += 1
+    return min_allocation + extra
+
 def calculate_intervention_costs(budget, interventions):
     """Calculate costs for different intervention strategies"""
-    costs = {
-        'salt_iodization': {
-            'unit_cost': 2.5,  # KSH per person per year
-            'effectiveness': 0.85,
-            'reach_time': 6  # months
-        },
-        'oil_fortification': {
-            'unit_cost': 15,  # KSH per person per 6 months
-            'effectiveness': 0.92,
-            'reach_time': 3
-        },
-        'direct_supplement': {
-            'unit_cost': 50,  # KSH per person per year
-            'effectiveness': 0.98,
-            'reach_time': 1
-        },
-        'school_program': {
-            'unit_cost': 8,  # KSH per child per year
-            'effectiveness': 0.88,
-            'reach_time': 2
-        }
-    }
-    return costs
+    return COSTS
 
 def simulate_health_outcomes(coverage, intervention_mix, timeline_months):
-    """Simulate health outcomes based on interventions"""
+    """Simulate health outcomes based on interventions
+
+    intervention_mix is a (salt, oil, supplement, school) tuple of budget
+    percentages.
+    """
     # Calculate weighted effectiveness
-    total_effectiveness = sum(intervention_mix.values()) / 100
+    total_effectiveness = sum(intervention_mix) / 100
     
     # Immediate effects (0-3 months)
     immediate = {
@@ -119,6 +172,234 @@ def simulate_health_outcomes(coverage, intervention_mix, timeline_months):
     
     return immediate, midterm, longterm
 
+# Streamlit 1.33+ reruns a fragment on its own instead of the whole script;
+# older releases (including the pinned 1.28) render it unchanged
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+@_fragment
+def render_report_download(report):
+    """Render the report download button
+
+    The button is the only widget outside the setup tab, so clicking it
+    reruns just this fragment instead of every tab's calculations.
+    """
+    st.download_button(
+        label="📥 Download Full Report",
+        data=report,
+        file_name=f"iodine_intervention_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
+        mime="text/markdown"
+    )
+
+# Markdown simulation report, filled in by build_report
+REPORT_TEMPLATE = """
+### Iodine Deficiency Intervention Simulation Results
+
+**Date:** {date}
+
+#### Investment Summary
+- **Total Budget:** KSH {total_budget:,.0f}
+- **Implementation Period:** {timeline_months} months
+- **Population Coverage:** {coverage_pct:.1f}% ({people_covered:,} people)
+- **Implementation Efficiency:** {implementation_efficiency}%
+
+#### Intervention Strategy
+- Salt Iodization: {salt_pct}% of budget
+- Oil Fortification: {oil_pct}% of budget
+- Direct Supplementation: {supplement_pct}% of budget
+- School Programs: {school_pct}% of budget
+
+#### Predicted Outcomes
+
+**Immediate (0-3 months):**
+- Urinary Iodine Normalized: {urinary_iodine_pct:.1f}% of covered population
+- Thyroid Function Improved: {thyroid_pct:.1f}%
+- Energy Levels Increased: {energy_pct:.1f}%
+
+**Mid-term (3-12 months):**
+- Goiter Reduction: {goiter_pct:.1f}%
+- Pregnancy Outcomes Improved: {pregnancy_pct:.1f}%
+- Child Cognitive Improvement: {cognitive_pct:.1f}%
+
+**Long-term (1-5 years):**
+- Average IQ Points Gained: {iq_points:.1f} points per child
+- Cretinism Cases Prevented: {cretinism:,} cases
+- Economic Productivity Gain: {productivity_pct:.1f}%
+
+#### Cost-Effectiveness
+- Cost per Person Reached: KSH {budget_per_person:.2f}
+- Cost per IQ Point: KSH {cost_per_iq_point:,.2f}
+- Return on Investment: {roi:.1f}%
+
+#### Recommendations
+"""
+
+def build_report(**kwargs):
+    """Fill the report template, returning bytes ready for download"""
+    return REPORT_TEMPLATE.format(**kwargs).encode()
+
+def compute_coverage(total_budget, salt_pct, oil_pct, supplement_pct, school_pct, efficiency):
+    """Return (max, actual) population coverage for a budget and allocation"""
+    # Simplified coverage calculation
+    avg_cost_per_person = (
+        salt_pct * 2.5 + 
+        oil_pct * 30 + 
+        supplement_pct * 50 + 
+        school_pct * 8
+    ) / 100
+    
+    max_coverage = min(1.0, total_budget / (avg_cost_per_person * AFFECTED_POPULATION))
+    return max_coverage, max_coverage * (efficiency / 100)
+
+def format_coverage_kpis(coverage):
+    """Pre-format the population reached, people covered and status strings"""
+    if coverage < 0.8:
+        color = "🔴"
+    elif coverage < 0.9:
+        color = "🟡"
+    else:
+        color = "🟢"
+    return (
+        f"{coverage*100:.1f}%",
+        f"{int(coverage * AFFECTED_POPULATION):,}",
+        f"{color} {'Low' if coverage < 0.8 else 'Good'}"
+    )
+
+def format_outcome_kpis(immediate, midterm, longterm):
+    """Pre-format the (value, delta) metric strings for each health outcome"""
+    kpis = {
+        key: (f"{value*100:.1f}%", f"+{value*100:.1f}%")
+        for key, value in {**immediate, **midterm}.items()
+    }
+    iq_points = longterm['iq_points_gained']
+    cretinism = longterm['cretinism_prevented']
+    productivity = longterm['economic_productivity_gain']
+    kpis['iq_points_gained'] = (f"{iq_points:.1f}", f"+{iq_points:.1f}")
+    kpis['cretinism_prevented'] = (f"{cretinism:,}", f"-{cretinism:,}")
+    kpis['economic_productivity_gain'] = (f"+{productivity*100:.1f}%", f"+{productivity*100:.1f}%")
+    return kpis
+
+@st.cache_resource
+def _deps():
+    """Import Plotly on first figure build rather than at script start
+
+    pandas and NumPy stay top-level imports: the allocation editor and the
+    module constants need them on every run.
+    """
+    import plotly.graph_objects as go
+    return SimpleNamespace(go=go)
+
+def build_timeline_fig(coverage, timeline_months):
+    """Build the intervention impact timeline figure"""
+    go = _deps().go
+    # One month index shared by every trace
+    months = np.arange(timeline_months + 1, dtype=np.int16)
+    month_axis = months.astype(np.float64)
+    
+    # Sigmoid growth function for realistic adoption, evaluated over
+    # the whole month axis in one vectorized exp
+    def sigmoid(L, k, x0):
+        return L / (1.0 + np.exp(-k * (month_axis - x0)))
+    
+    coverage_timeline = sigmoid(coverage*100, 0.3, timeline_months/3)
+    iodine_sufficiency = sigmoid(coverage*100*0.9, 0.25, timeline_months/2.5)
+    health_improvement = sigmoid(coverage*100*0.7, 0.2, timeline_months/2)
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=months, y=coverage_timeline,
+        mode='lines', name='Population Coverage',
+        line=dict(color='blue', width=3)
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=months, y=iodine_sufficiency,
+        mode='lines', name='Iodine Sufficiency',
+        line=dict(color='green', width=3)
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=months, y=health_improvement,
+        mode='lines', name='Health Outcomes',
+        line=dict(color='purple', width=3)
+    ))
+    
+    fig.update_layout(
+        title="Intervention Impact Over Time",
+        xaxis_title="Months",
+        yaxis_title="Percentage (%)",
+        yaxis=dict(range=[0, 100]),
+        hovermode='x unified',
+        height=400
+    )
+    return fig
+
+def build_pie_fig(budgets):
+    """Build the budget distribution pie from per-intervention budgets"""
+    go = _deps().go
+    fig_pie = go.Figure(go.Pie(
+        labels=INTERVENTION_NAMES,
+        values=budgets,
+        marker_colors=INTERVENTION_COLORS
+    ))
+    fig_pie.update_layout(title="Budget Distribution")
+    return fig_pie
+
+def build_benefits_fig(total_benefits, total_budget):
+    """Build the cumulative benefits vs investment figure"""
+    go = _deps().go
+    years = list(range(1, 6))
+    cumulative_benefits = [total_benefits * (y/5) * 0.8 for y in years]
+    
+    fig_benefits = go.Figure()
+    fig_benefits.add_trace(go.Bar(
+        x=years,
+        y=cumulative_benefits,
+        name='Cumulative Benefits',
+        marker_color='green'
+    ))
+    fig_benefits.add_trace(go.Scatter(
+        x=years,
+        y=[total_budget] * 5,
+        mode='lines',
+        name='Investment',
+        line=dict(color='red', dash='dash')
+    ))
+    
+    fig_benefits.update_layout(
+        title="Cost vs Benefits Over Time",
+        xaxis_title="Years",
+        yaxis_title="Value (KSH)",
+        hovermode='x unified'
+    )
+    return fig_benefits
+
+def build_comparison_fig(coverage, roi, iq_points_gained):
+    """Build the scenario comparison bar chart"""
+    go = _deps().go
+    values = SCENARIO_MULT * np.array([coverage * 100, roi, iq_points_gained]) + SCENARIO_OFFSET
+    scenario_df = pd.DataFrame(values, index=SCENARIO_NAMES, columns=SCENARIO_METRICS)
+    
+    # Create comparison chart
+    fig_comparison = go.Figure()
+    
+    for metric in scenario_df.columns:
+        fig_comparison.add_trace(go.Bar(
+            name=metric,
+            x=scenario_df.index,
+            y=scenario_df[metric],
+            text=scenario_df[metric].round(1)
+        ))
+    
+    fig_comparison.update_layout(
+        title="Scenario Comparison",
+        barmode='group',
+        xaxis_title="Scenario",
+        yaxis_title="Value",
+        height=400
+    )
+    return fig_comparison
+
 # INTERVENTION SETUP TAB
 with tab1:
     st.header("🎯 Configure Intervention Strategy")
@@ -222,59 +503,36 @@ with tab1:
         st.write("**Budget Allocation (%):**")
         
         # Count active interventions
-        active_count = sum([use_salt, use_oil, use_supplement, use_school])
+        active_count = sum((use_salt, use_oil, use_supplement, use_school))
         
         if active_count == 0:
             st.error("⚠️ Please select at least one intervention strategy!")
             salt_pct = oil_pct = supplement_pct = school_pct = 0
         else:
-            # Calculate max value for each slider
-            max_per_intervention = 100 - (min_allocation * (active_count - 1))
-            
-            # Intervention sliders with dynamic min/max
-            if use_salt:
-                salt_pct = st.slider(
-                    "🧂 Salt Iodization Program",
-                    min_value=min_allocation,
-                    max_value=max_per_intervention,
-                    value=min(40, max_per_intervention),
-                    help="Fix and maintain salt iodization infrastructure"
-                )
-            else:
-                salt_pct = 0
-            
-            if use_oil:
-                remaining = 100 - salt_pct
-                oil_max = min(max_per_intervention, remaining - min_allocation * (sum([use_supplement, use_school])))
-                oil_pct = st.slider(
-                    "🛢️ Oil Fortification",
-                    min_value=min_allocation,
-                    max_value=max(min_allocation, oil_max),
-                    value=min(20, max(min_allocation, oil_max)),
-                    help="Fortify cooking oil with iodine (longer retention)"
-                )
-            else:
-                oil_pct = 0
+            # One editable weight per active intervention
+            active = np.array([use_salt, use_oil, use_supplement, use_school])
+            edited = st.data_editor(
+                pd.DataFrame(
+                    {"Allocation (%)": np.array(DEFAULT_ALLOCATION)[active]},
+                    index=np.array(ALLOCATION_LABELS)[active]
+                ),
+                column_config={
+                    "Allocation (%)": st.column_config.NumberColumn(min_value=0, max_value=100, step=1)
+                },
+                use_container_width=True
+            )
             
-            if use_supplement:
-                remaining = 100 - salt_pct - oil_pct
-                supp_max = min(max_per_intervention, remaining - min_allocation * sum([use_school]))
-                supplement_pct = st.slider(
-                    "💊 Direct Supplementation",
-                    min_value=min_allocation,
-                    max_value=max(min_allocation, supp_max),
-                    value=min(25, max(min_allocation, supp_max)),
-                    help="Pills/drops for high-risk groups"
-                )
-            else:
-                supplement_pct = 0
+            # Re-normalize the weights to 100% with the minimum allocation
+            # reserved for each active intervention
+            shares = normalize_allocation(edited["Allocation (%)"].to_numpy(), min_allocation)
+            allocation = np.zeros(len(active), dtype=int)
+            allocation[active] = shares
+            salt_pct, oil_pct, supplement_pct, school_pct = (int(pct) for pct in allocation)
             
-            if use_school:
-                # School gets the remainder to ensure 100% total
-                school_pct = 100 - salt_pct - oil_pct - supplement_pct
-                st.info(f"🏫 School Feeding Programs: **{school_pct}%** (auto-calculated remainder)")
-            else:
-                school_pct = 0
+            if shares.tolist() != edited["Allocation (%)"].tolist():
+                st.info("Weights re-normalized to 100%: " + ", ".join(
+                    f"{label} **{pct}%**" for label, pct in zip(np.array(ALLOCATION_LABELS)[active], shares)
+                ))
         
         # Check if allocation equals 100%
         total_allocation = salt_pct + oil_pct + supplement_pct + school_pct
@@ -296,22 +554,7 @@ with tab1:
         st.subheader("📊 Coverage Estimation")
         
         # Calculate coverage based on budget and intervention mix
-        intervention_mix = {
-            'salt': salt_pct,
-            'oil': oil_pct,
-            'supplement': supplement_pct,
-            'school': school_pct
-        }
-        
-        # Simplified coverage calculation
-        avg_cost_per_person = (
-            salt_pct * 2.5 + 
-            oil_pct * 30 + 
-            supplement_pct * 50 + 
-            school_pct * 8
-        ) / 100
-        
-        max_coverage = min(1.0, total_budget / (avg_cost_per_person * AFFECTED_POPULATION))
+        intervention_mix = (salt_pct, oil_pct, supplement_pct, school_pct)
         
         # Add implementation efficiency
         implementation_efficiency = st.slider(
@@ -322,22 +565,19 @@ with tab1:
             help="Account for logistics, corruption, wastage"
         )
         
-        actual_coverage = max_coverage * (implementation_efficiency / 100)
+        max_coverage, actual_coverage = compute_coverage(
+            total_budget, *intervention_mix, implementation_efficiency
+        )
         
         # Display coverage metrics
         col_a, col_b, col_c = st.columns(3)
+        reached_kpi, covered_kpi, status_kpi = format_coverage_kpis(actual_coverage)
         with col_a:
-            st.metric("Population Reached", f"{actual_coverage*100:.1f}%")
+            st.metric("Population Reached", reached_kpi)
         with col_b:
-            st.metric("People Covered", f"{int(actual_coverage * AFFECTED_POPULATION):,}")
+            st.metric("People Covered", covered_kpi)
         with col_c:
-            if actual_coverage < 0.8:
-                color = "🔴"
-            elif actual_coverage < 0.9:
-                color = "🟡"
-            else:
-                color = "🟢"
-            st.metric("Coverage Status", f"{color} {'Low' if actual_coverage < 0.8 else 'Good'}")
+            st.metric("Coverage Status", status_kpi)
 
 # OUTCOMES PREDICTION TAB
 with tab2:
@@ -348,120 +588,40 @@ with tab2:
         immediate, midterm, longterm = simulate_health_outcomes(
             actual_coverage, intervention_mix, timeline_months
         )
+        kpis = format_outcome_kpis(immediate, midterm, longterm)
         
         # Create three columns for different time periods
         col1, col2, col3 = st.columns(3)
         
         with col1:
             st.subheader("🚀 Immediate (0-3 months)")
-            st.metric(
-                "Urinary Iodine Normalized",
-                f"{immediate['urinary_iodine_normalized']*100:.1f}%",
-                delta=f"+{immediate['urinary_iodine_normalized']*100:.1f}%"
-            )
-            st.metric(
-                "Thyroid Function Improved",
-                f"{immediate['thyroid_function_improved']*100:.1f}%",
-                delta=f"+{immediate['thyroid_function_improved']*100:.1f}%"
-            )
-            st.metric(
-                "Energy Levels Increased",
-                f"{immediate['energy_levels_increased']*100:.1f}%",
-                delta=f"+{immediate['energy_levels_increased']*100:.1f}%"
-            )
+            st.metric("Urinary Iodine Normalized", *kpis['urinary_iodine_normalized'])
+            st.metric("Thyroid Function Improved", *kpis['thyroid_function_improved'])
+            st.metric("Energy Levels Increased", *kpis['energy_levels_increased'])
         
         with col2:
             st.subheader("📊 Mid-term (3-12 months)")
-            st.metric(
-                "Goiter Reduction",
-                f"{midterm['goiter_reduction']*100:.1f}%",
-                delta=f"+{midterm['goiter_reduction']*100:.1f}%"
-            )
-            st.metric(
-                "Pregnancy Outcomes",
-                f"{midterm['pregnancy_outcomes_improved']*100:.1f}%",
-                delta=f"+{midterm['pregnancy_outcomes_improved']*100:.1f}%"
-            )
-            st.metric(
-                "Child Cognitive Gains",
-                f"{midterm['child_cognitive_improvement']*100:.1f}%",
-                delta=f"+{midterm['child_cognitive_improvement']*100:.1f}%"
-            )
+            st.metric("Goiter Reduction", *kpis['goiter_reduction'])
+            st.metric("Pregnancy Outcomes", *kpis['pregnancy_outcomes_improved'])
+            st.metric("Child Cognitive Gains", *kpis['child_cognitive_improvement'])
         
         with col3:
             st.subheader("🎯 Long-term (1-5 years)")
-            st.metric(
-                "Avg IQ Points Gained",
-                f"{longterm['iq_points_gained']:.1f}",
-                delta=f"+{longterm['iq_points_gained']:.1f}"
-            )
-            st.metric(
-                "Cretinism Cases Prevented",
-                f"{longterm['cretinism_prevented']:,}",
-                delta=f"-{longterm['cretinism_prevented']:,}"
-            )
-            st.metric(
-                "Economic Productivity",
-                f"+{longterm['economic_productivity_gain']*100:.1f}%",
-                delta=f"+{longterm['economic_productivity_gain']*100:.1f}%"
-            )
+            st.metric("Avg IQ Points Gained", *kpis['iq_points_gained'])
+            st.metric("Cretinism Cases Prevented", *kpis['cretinism_prevented'])
+            st.metric("Economic Productivity", *kpis['economic_productivity_gain'])
         
         # Timeline visualization
         st.subheader("📅 Impact Timeline")
         
-        # Create timeline data
-        months = list(range(0, timeline_months + 1))
-        
-        # Sigmoid growth function for realistic adoption
-        def sigmoid(x, L, k, x0):
-            return L / (1 + np.exp(-k*(x-x0)))
-        
-        coverage_timeline = [sigmoid(m, actual_coverage*100, 0.3, timeline_months/3) for m in months]
-        iodine_sufficiency = [sigmoid(m, actual_coverage*100*0.9, 0.25, timeline_months/2.5) for m in months]
-        health_improvement = [sigmoid(m, actual_coverage*100*0.7, 0.2, timeline_months/2) for m in months]
-        
-        # Create plotly figure
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=months, y=coverage_timeline,
-            mode='lines', name='Population Coverage',
-            line=dict(color='blue', width=3)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=months, y=iodine_sufficiency,
-            mode='lines', name='Iodine Sufficiency',
-            line=dict(color='green', width=3)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=months, y=health_improvement,
-            mode='lines', name='Health Outcomes',
-            line=dict(color='purple', width=3)
-        ))
-        
-        fig.update_layout(
-            title="Intervention Impact Over Time",
-            xaxis_title="Months",
-            yaxis_title="Percentage (%)",
-            yaxis=dict(range=[0, 100]),
-            hovermode='x unified',
-            height=400
-        )
-        
+        fig = build_timeline_fig(actual_coverage, timeline_months)
         st.plotly_chart(fig, use_container_width=True)
         
         # Risk factors
         st.subheader("⚠️ Risk Factors")
         
         risk_cols = st.columns(4)
-        risks = {
-            "Supply Chain": np.random.uniform(0.2, 0.8),
-            "Quality Control": np.random.uniform(0.3, 0.9),
-            "Community Adoption": np.random.uniform(0.4, 0.95),
-            "Political Stability": np.random.uniform(0.5, 0.9)
-        }
+        risks = dict(zip(RISK_FACTORS, RNG.uniform(RISK_LOWS, RISK_HIGHS)))
         
         for i, (risk, value) in enumerate(risks.items()):
             with risk_cols[i]:
@@ -481,43 +641,32 @@ with tab3:
             st.subheader("💵 Cost Breakdown")
             
             # Calculate costs for each intervention
-            costs_data = {
-                'Intervention': ['Salt Iodization', 'Oil Fortification', 'Direct Supplements', 'School Programs'],
-                'Budget (KSH)': [
-                    total_budget * salt_pct / 100,
-                    total_budget * oil_pct / 100,
-                    total_budget * supplement_pct / 100,
-                    total_budget * school_pct / 100
-                ],
-                'People Reached': [
-                    int(actual_coverage * AFFECTED_POPULATION * salt_pct / 100),
-                    int(actual_coverage * AFFECTED_POPULATION * oil_pct / 100),
-                    int(actual_coverage * AFFECTED_POPULATION * supplement_pct / 100),
-                    int(actual_coverage * CHILDREN_UNDER_5 * school_pct / 100)
-                ]
-            }
+            pcts = np.array(intervention_mix, dtype=np.float64)
+            budgets = total_budget * pcts / 100
+            # School programs reach children; truncate like int() did
+            reached = (actual_coverage * TARGET_POPULATIONS * pcts / 100).astype(np.int64)
             
-            costs_df = pd.DataFrame(costs_data)
-            costs_df['Cost per Person'] = costs_df['Budget (KSH)'] / costs_df['People Reached'].replace(0, 1)
+            costs_df = pd.DataFrame({
+                'Intervention': INTERVENTION_NAMES,
+                'Budget (KSH)': budgets,
+                'People Reached': reached,
+                'Cost per Person': budgets / np.maximum(reached, 1)
+            })
             
-            # Display cost table
+            # Display cost table, pre-formatted as strings so the four rows
+            # skip pandas Styler's HTML rendering
             st.dataframe(
-                costs_df.style.format({
-                    'Budget (KSH)': '{:,.0f}',
-                    'People Reached': '{:,.0f}',
-                    'Cost per Person': 'KSH {:.2f}'
+                pd.DataFrame({
+                    'Intervention': INTERVENTION_NAMES,
+                    'Budget (KSH)': costs_df['Budget (KSH)'].map('{:,.0f}'.format),
+                    'People Reached': costs_df['People Reached'].map('{:,.0f}'.format),
+                    'Cost per Person': costs_df['Cost per Person'].map('KSH {:.2f}'.format)
                 }),
                 use_container_width=True
             )
             
             # Pie chart of budget allocation
-            fig_pie = px.pie(
-                costs_df, 
-                values='Budget (KSH)', 
-                names='Intervention',
-                title="Budget Distribution",
-                color_discrete_sequence=px.colors.qualitative.Set3
-            )
+            fig_pie = build_pie_fig(costs_df['Budget (KSH)'])
             st.plotly_chart(fig_pie, use_container_width=True)
         
         with col2:
@@ -548,31 +697,7 @@ with tab3:
                 st.error(f"🔴 ROI: {roi:.1f}% - Intervention needs optimization")
             
             # Benefit timeline
-            years = list(range(1, 6))
-            cumulative_benefits = [total_benefits * (y/5) * 0.8 for y in years]
-            
-            fig_benefits = go.Figure()
-            fig_benefits.add_trace(go.Bar(
-                x=years,
-                y=cumulative_benefits,
-                name='Cumulative Benefits',
-                marker_color='green'
-            ))
-            fig_benefits.add_trace(go.Scatter(
-                x=years,
-                y=[total_budget] * 5,
-                mode='lines',
-                name='Investment',
-                line=dict(color='red', dash='dash')
-            ))
-            
-            fig_benefits.update_layout(
-                title="Cost vs Benefits Over Time",
-                xaxis_title="Years",
-                yaxis_title="Value (KSH)",
-                hovermode='x unified'
-            )
-            
+            fig_benefits = build_benefits_fig(total_benefits, total_budget)
             st.plotly_chart(fig_benefits, use_container_width=True)
 
 # REPORTS TAB
@@ -583,49 +708,32 @@ with tab4:
         # Generate comprehensive report
         st.subheader("Executive Summary")
         
-        report = f"""
-        ### Iodine Deficiency Intervention Simulation Results
-        
-        **Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
-        
-        #### Investment Summary
-        - **Total Budget:** KSH {total_budget:,.0f}
-        - **Implementation Period:** {timeline_months} months
-        - **Population Coverage:** {actual_coverage*100:.1f}% ({int(actual_coverage * AFFECTED_POPULATION):,} people)
-        - **Implementation Efficiency:** {implementation_efficiency}%
-        
-        #### Intervention Strategy
-        - Salt Iodization: {salt_pct}% of budget
-        - Oil Fortification: {oil_pct}% of budget
-        - Direct Supplementation: {supplement_pct}% of budget
-        - School Programs: {school_pct}% of budget
-        
-        #### Predicted Outcomes
-        
-        **Immediate (0-3 months):**
-        - Urinary Iodine Normalized: {immediate['urinary_iodine_normalized']*100:.1f}% of covered population
-        - Thyroid Function Improved: {immediate['thyroid_function_improved']*100:.1f}%
-        - Energy Levels Increased: {immediate['energy_levels_increased']*100:.1f}%
-        
-        **Mid-term (3-12 months):**
-        - Goiter Reduction: {midterm['goiter_reduction']*100:.1f}%
-        - Pregnancy Outcomes Improved: {midterm['pregnancy_outcomes_improved']*100:.1f}%
-        - Child Cognitive Improvement: {midterm['child_cognitive_improvement']*100:.1f}%
-        
-        **Long-term (1-5 years):**
-        - Average IQ Points Gained: {longterm['iq_points_gained']:.1f} points per child
-        - Cretinism Cases Prevented: {longterm['cretinism_prevented']:,} cases
-        - Economic Productivity Gain: {longterm['economic_productivity_gain']*100:.1f}%
-        
-        #### Cost-Effectiveness
-        - Cost per Person Reached: KSH {budget_per_person:.2f}
-        - Cost per IQ Point: KSH {cost_per_iq_point:,.2f}
-        - Return on Investment: {roi:.1f}%
-        
-        #### Recommendations
-        """
+        report = build_report(
+            date=datetime.now().strftime('%Y-%m-%d %H:%M'),
+            total_budget=total_budget,
+            timeline_months=timeline_months,
+            coverage_pct=actual_coverage*100,
+            people_covered=int(actual_coverage * AFFECTED_POPULATION),
+            implementation_efficiency=implementation_efficiency,
+            salt_pct=salt_pct,
+            oil_pct=oil_pct,
+            supplement_pct=supplement_pct,
+            school_pct=school_pct,
+            urinary_iodine_pct=immediate['urinary_iodine_normalized']*100,
+            thyroid_pct=immediate['thyroid_function_improved']*100,
+            energy_pct=immediate['energy_levels_increased']*100,
+            goiter_pct=midterm['goiter_reduction']*100,
+            pregnancy_pct=midterm['pregnancy_outcomes_improved']*100,
+            cognitive_pct=midterm['child_cognitive_improvement']*100,
+            iq_points=longterm['iq_points_gained'],
+            cretinism=longterm['cretinism_prevented'],
+            productivity_pct=longterm['economic_productivity_gain']*100,
+            budget_per_person=budget_per_person,
+            cost_per_iq_point=cost_per_iq_point,
+            roi=roi
+        )
         
-        st.markdown(report)
+        st.markdown(report.decode())
         
         # Generate recommendations based on results
         recommendations = []
@@ -649,58 +757,13 @@ with tab4:
             st.markdown(f"- {rec}")
         
         # Download button for report
-        st.download_button(
-            label="📥 Download Full Report",
-            data=report,
-            file_name=f"iodine_intervention_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
-            mime="text/markdown"
-        )
+        render_report_download(report)
         
         # Scenario comparison
         st.subheader("🔄 Scenario Comparison")
         
-        scenarios = {
-            "Current Plan": {
-                "Coverage": actual_coverage * 100,
-                "ROI": roi,
-                "IQ Gain": longterm['iq_points_gained']
-            },
-            "Maximum Coverage": {
-                "Coverage": 95,
-                "ROI": roi * 0.8,
-                "IQ Gain": longterm['iq_points_gained'] * 1.2
-            },
-            "Cost-Optimized": {
-                "Coverage": actual_coverage * 100 * 0.7,
-                "ROI": roi * 1.5,
-                "IQ Gain": longterm['iq_points_gained'] * 0.8
-            },
-            "Emergency Response": {
-                "Coverage": actual_coverage * 100 * 1.1,
-                "ROI": roi * 0.6,
-                "IQ Gain": longterm['iq_points_gained'] * 1.3
-            }
-        }
-        
-        scenario_df = pd.DataFrame(scenarios).T
-        
-        # Create comparison chart
-        fig_comparison = go.Figure()
-        
-        for metric in scenario_df.columns:
-            fig_comparison.add_trace(go.Bar(
-                name=metric,
-                x=scenario_df.index,
-                y=scenario_df[metric],
-                text=scenario_df[metric].round(1)
-            ))
-        
-        fig_comparison.update_layout(
-            title="Scenario Comparison",
-            barmode='group',
-            xaxis_title="Scenario",
-            yaxis_title="Value",
-            height=400
+        fig_comparison = build_comparison_fig(
+            actual_coverage, roi, longterm['iq_points_gained']
         )
         
         st.plotly_chart(fig_comparison, use_container_width=True)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the vectorized budget optimization validation helpers
+"""
+
+import numpy as np
+
+from budget_optimization_validation import compute_roi_curve
+
+
+def test_compute_roi_curve():
+    """Test the ROI sweep kernel against the scalar formulas"""
+
+    print("=" * 60)
+    print("ROI CURVE KERNEL TEST")
+    print("=" * 60)
+
+    target_population = 11_146_856
+    annual_cost = 40_000
+    base_benefit = 15_000_000_000
+    budgets = np.array([0, 100, 500, 2_000, 446_000, 1_000_000], dtype=np.float64) * 1_000_000
+
+    coverage, efficiency, roi = compute_roi_curve(budgets, target_population, annual_cost, base_benefit)
+
+    for i, budget in enumerate(budgets):
+        expected_coverage = min(1.0, budget / (target_population * annual_cost))
+        expected_efficiency = 1.0 - (0.3 * expected_coverage)
+        benefit = base_benefit * expected_coverage * expected_efficiency
+        expected_roi = ((benefit - budget) / budget * 100) if budget > 0 else 0
+
+        print(f"Budget {budget/1e6:>9,.0f}M: coverage {coverage[i]:.4f}, ROI {roi[i]:8.2f}%")
+        assert np.isclose(coverage[i], expected_coverage)
+        assert np.isclose(efficiency[i], expected_efficiency)
+        assert np.isclose(roi[i], expected_roi)
+
+    assert np.all(coverage <= 1.0)
+    assert coverage[-1] == 1.0
+
+    print("✅ ROI curve checks passed")
+
+
+if __name__ == "__main__":
+    test_compute_roi_curve()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Test script to verify data validator checks
+"""
+
+import numpy as np
+import pandas as pd
+
+import data_validator
+from data_validator import DataValidator, clean_and_standardize_districts
+
+
+def test_nutrient_validation():
+    """Test missing value, outlier and negative value detection"""
+
+    print("=" * 60)
+    print("NUTRIENT DATA VALIDATION TEST")
+    print("=" * 60)
+
+    nutrition_df = pd.DataFrame({
+        'District': ['KAMPALA', 'WAKISO', 'MUKONO', 'JINJA'],
+        'Iron_(mg)': [45, 50, np.nan, -10],
+        'Zinc_(mg)': [60, 65, 58, 250],
+        'Calcium_(mg)': [80, 90, 85, 95]
+    })
+
+    validator = DataValidator()
+    results = validator.validate_nutrient_data(nutrition_df)
+
+    print(f"Nutrients tracked: {results['nutrients_tracked']}")
+    print(f"Missing values: {results['missing_values']}")
+    print(f"Outliers: {results['outliers']}")
+    print(f"Invalid ranges: {results['invalid_ranges']}")
+
+    assert results['nutrients_tracked'] == 3
+    assert results['missing_values'] == {'Iron_(mg)': 1}
+    assert results['outliers'] == {'Iron_(mg)': 1, 'Zinc_(mg)': 1}
+    assert results['invalid_ranges'] == {'Iron_(mg)': 'negative_values'}
+
+    summary = validator.get_validation_summary()
+    assert summary['errors'] == 3
+    assert summary['warnings'] == 1
+
+    # Nullable dtypes report pd.NA as missing
+    nullable_df = pd.DataFrame({
+        'Iron_(mg)': pd.array([45, None, 250], dtype='Int64'),
+        'Zinc_(mg)': pd.array([60.0, 65.0, None], dtype='Float64')
+    })
+    results = DataValidator().validate_nutrient_data(nullable_df)
+    assert results['missing_values'] == {'Iron_(mg)': 1, 'Zinc_(mg)': 1}
+    assert results['outliers'] == {'Iron_(mg)': 1}
+
+    print("✅ Nutrient validation checks passed")
+
+
+def test_district_name_matching():
+    """Test fuzzy mapping of misspelled district names"""
+
+    print("=" * 60)
+    print("DISTRICT NAME MATCHING TEST")
+    print("=" * 60)
+
+    nutrition_df = pd.DataFrame({'District': ['Kampala', 'Wakisoo', 'Mukono', 'Nowhere']})
+    population_df = pd.DataFrame({
+        'District': ['KAMPALA', 'WAKISO', 'MUKONO', 'JINJA'],
+        'ADM2_EN': ['KAMPALA', 'WAKISO', 'MUKONO', 'JINJA']
+    })
+    facilities_df = pd.DataFrame({'District': ['Kampala', 'Wakiso', 'Mukono', 'Gulu']})
+
+    fast_path = data_validator.RAPIDFUZZ_AVAILABLE
+    try:
+        for use_rapidfuzz in sorted({False, fast_path}):
+            data_validator.RAPIDFUZZ_AVAILABLE = use_rapidfuzz
+            results = DataValidator().validate_district_names(
+                nutrition_df, population_df, facilities_df
+            )
+            print(f"rapidfuzz={use_rapidfuzz}: mapping {results['mapping']}")
+
+            assert results['common_to_all'] == {'KAMPALA', 'MUKONO'}
+            assert results['nutrition_only'] == {'WAKISOO', 'NOWHERE'}
+            assert results['mapping'] == {'WAKISOO': 'WAKISO'}
+    finally:
+        data_validator.RAPIDFUZZ_AVAILABLE = fast_path
+
+    # Identical district sets take the fast path
+    validator = DataValidator()
+    results = validator.validate_district_names(population_df, population_df, population_df)
+    assert results['common_to_all'] == {'KAMPALA', 'WAKISO', 'MUKONO', 'JINJA'}
+    assert results['total_unique_districts'] == 4
+    assert not results['nutrition_only'] and not results['mapping']
+    assert validator.validation_results['info'] == ["Found 4 districts common to all datasets"]
+
+    print("✅ District matching checks passed")
+
+
+def test_reconcile_data():
+    """Test uppercasing and district mapping during reconciliation"""
+
+    print("=" * 60)
+    print("DATA RECONCILIATION TEST")
+    print("=" * 60)
+
+    nutrition_df = pd.DataFrame({'District': ['Kampala', 'Wakisoo', None, 'kampala']})
+    population_df = pd.DataFrame({'ADM2_EN': ['Kampala', 'Wakiso']})
+    facilities_df = pd.DataFrame({'District': ['Gulu', 'kampala']})
+
+    validator = DataValidator()
+    nutrition_fixed, population_fixed, facilities_fixed = validator.reconcile_data(
+        nutrition_df, population_df, facilities_df, {'WAKISOO': 'WAKISO'}
+    )
+    print(nutrition_fixed)
+
+    assert nutrition_fixed['District'].tolist()[:2] == ['KAMPALA', 'WAKISO']
+    assert pd.isna(nutrition_fixed['District'].iloc[2])
+    assert nutrition_fixed['District'].iloc[3] == 'KAMPALA'
+    assert population_fixed['ADM2_EN'].tolist() == ['KAMPALA', 'WAKISO']
+    assert facilities_fixed['District'].tolist() == ['GULU', 'KAMPALA']
+    assert nutrition_df['District'].iloc[1] == 'Wakisoo'
+
+    print("✅ Reconciliation checks passed")
+
+
+def test_population_anomalies():
+    """Test zero population and 3-sigma anomaly detection"""
+
+    print("=" * 60)
+    print("POPULATION VALIDATION TEST")
+    print("=" * 60)
+
+    population_df = pd.DataFrame({
+        'ADM2_EN': [f'DISTRICT_{i}' for i in range(30)],
+        'T_TL': [100_000] * 28 + [0, 5_000_000]
+    })
+
+    validator = DataValidator()
+    results = validator.validate_population_data(population_df)
+    print(f"Zero population: {results['districts_with_zero_pop']}")
+    print(f"Anomalies: {results['population_anomalies']}")
+
+    assert results['total_population'] == 7_800_000
+    assert results['districts_with_zero_pop'] == ['DISTRICT_28']
+    assert results['population_anomalies'] == [{'ADM2_EN': 'DISTRICT_29', 'T_TL': 5_000_000}]
+
+    print("✅ Population validation checks passed")
+
+
+def test_clean_and_standardize_districts():
+    """Test whitespace, DISTRICT affix and misspelling cleanup"""
+
+    print("=" * 60)
+    print("DISTRICT CLEANUP TEST")
+    print("=" * 60)
+
+    df = pd.DataFrame({
+        'District': ['  Gulu District ', 'District Luwero', 'kalangla', 'Jinja'],
+        'Hospitals': [1, 2, 3, 4]
+    })
+    cleaned = clean_and_standardize_districts(df, 'District')
+    print(cleaned)
+
+    assert cleaned['District'].tolist() == ['GULU', 'LUWEERO', 'KALANGALA', 'JINJA']
+    assert cleaned['Hospitals'].tolist() == [1, 2, 3, 4]
+    assert df['District'].iloc[0] == '  Gulu District '
+
+    print("✅ District cleanup checks passed")
+
+
+if __name__ == "__main__":
+    test_nutrient_validation()
+    test_district_name_matching()
+    test_reconcile_data()
+    test_population_anomalies()
+    test_clean_and_standardize_districts()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the iodine simulator's budget allocation normalization
+"""
+
+import ast
+from pathlib import Path
+
+import numpy as np
+
+SIMULATOR_PATH = Path(__file__).with_name("iodine_intervention_simulator.py")
+
+
+def load_normalize_allocation():
+    """Pull normalize_allocation out of the simulator without running the Streamlit page"""
+
+    tree = ast.parse(SIMULATOR_PATH.read_text(encoding="utf-8"))
+    func = next(node for node in tree.body
+                if isinstance(node, ast.FunctionDef) and node.name == "normalize_allocation")
+    namespace = {"np": np}
+    exec(compile(ast.Module(body=[func], type_ignores=[]), str(SIMULATOR_PATH), "exec"), namespace)
+    return namespace["normalize_allocation"]
+
+
+def test_minimum_allocation_enforced():
+    """Test that every active intervention gets at least the minimum share"""
+
+    print("=" * 60)
+    print("MINIMUM ALLOCATION TEST")
+    print("=" * 60)
+
+    normalize_allocation = load_normalize_allocation()
+
+    cases = [
+        ([100, 100, 100, 5], 5),
+        ([100, 0, 0, 0], 10),
+        ([0, 0, 0, 0], 5),
+        ([np.nan, 50], 25),
+        ([-5, 10, 3], 0),
+    ]
+    for weights, min_allocation in cases:
+        shares = normalize_allocation(weights, min_allocation)
+        print(f"{weights} (min {min_allocation}%) -> {shares.tolist()}")
+
+        assert shares.sum() == 100
+        assert (shares >= min_allocation).all()
+
+    assert normalize_allocation([100, 100, 100, 5], 5).tolist() == [32, 32, 31, 5]
+    assert normalize_allocation([100, 0, 0, 0], 10).tolist() == [70, 10, 10, 10]
+
+    print("✅ Minimum allocation checks passed")
+
+
+def test_valid_allocation_unchanged():
+    """Test that an allocation already summing to 100% above the minimum is kept"""
+
+    print("=" * 60)
+    print("VALID ALLOCATION TEST")
+    print("=" * 60)
+
+    normalize_allocation = load_normalize_allocation()
+
+    for weights, min_allocation in [([40, 20, 25, 15], 5), ([40, 20, 25, 15], 15), ([70, 30], 0)]:
+        shares = normalize_allocation(weights, min_allocation)
+        print(f"{weights} (min {min_allocation}%) -> {shares.tolist()}")
+        assert shares.tolist() == weights
+
+    # Proportional split of the remainder, rounded to whole percents
+    assert normalize_allocation([1, 1, 1], 0).tolist() == [34, 33, 33]
+    assert normalize_allocation([50, 50, 50, 50], 0).tolist() == [25, 25, 25, 25]
+
+    print("✅ Valid allocation checks passed")
+
+
+if __name__ == "__main__":
+    test_minimum_allocation_enforced()
+    test_valid_allocation_unchanged()
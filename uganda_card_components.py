@@ -10,10 +10,8 @@ import plotly.express as px
 from typing import Dict, List, Optional, Tuple, Any
 import pandas as pd
 
-def apply_card_styling():
-    """Apply comprehensive card-based styling to the dashboard"""
-    
-    st.markdown("""
+# Card stylesheet, built once at import and re-emitted on every rerun
+_CARD_CSS = """
     <style>
         /* ============================================
            CARD FOUNDATION STYLES
@@ -431,7 +429,14 @@ def apply_card_styling():
             }
         }
     </style>
-    """, unsafe_allow_html=True)
+"""
+
+def apply_card_styling():
+    """Apply comprehensive card-based styling to the dashboard"""
+    
+    # Streamlit rebuilds the page on each rerun, so the <style> block must be
+    # emitted every time; only the string itself is shared
+    st.markdown(_CARD_CSS, unsafe_allow_html=True)
 
 def create_budget_coverage_cards(budget_data: Dict) -> None:
     """Create the budget and coverage metric cards in three columns with context
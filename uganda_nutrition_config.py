@@ -10,6 +10,20 @@ from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 import requests
 
+# Shared PCG64 generator for the simulated variability below
+_RNG = np.random.default_rng()
+
+# Monitoring metric noise bounds, in the order the metrics are built:
+# coverage, compliance (relative +/-10%), stock levels, quality (relative),
+# beneficiary feedback, cost efficiency, stunting, wasting, anemia reduction
+_MONITORING_NOISE_LOW = (-0.1, -0.1, -15, -0.05, -0.3, -0.1, -1, -0.5, -1.5)
+_MONITORING_NOISE_HIGH = (0.1, 0.1, 20, 0.05, 0.3, 0.1, 1, 0.5, 1.5)
+
+# District characteristic ranges: poverty multiplier, health access,
+# malnutrition multiplier
+_RURAL_DISTRICT_LOW, _RURAL_DISTRICT_HIGH = (1.2, 0.3, 1.1), (1.8, 0.6, 1.4)
+_URBAN_DISTRICT_LOW, _URBAN_DISTRICT_HIGH = (0.7, 0.6, 0.8), (1.0, 0.9, 1.0)
+
 class NutritionDataConfig:
     """Dynamic configuration system for Uganda nutrition program"""
     
@@ -253,53 +267,38 @@ class NutritionDataConfig:
         inflation = self.baseline_data['economic_indicators']['inflation_rate']
         exchange_rate_depreciation = 0.02  # 2% annual
         
-        # Cost structure (based on program maturity)
-        cost_structure = []
-        benefit_structure = []
-        
-        for year in range(years):
-            # Costs decrease due to economies of scale
-            if year == 0:
-                cost_multiplier = 1.2  # Higher initial setup costs
-            else:
-                cost_multiplier = 0.9 - (0.05 * min(year, 5))  # Decreasing costs
-            
-            annual_cost = base_budget * cost_multiplier * ((1 + inflation) ** year)
-            cost_structure.append(annual_cost)
-            
-            # Benefits increase as program matures
-            if year == 0:
-                benefit_multiplier = 0.3  # Low initial benefits
-            else:
-                benefit_multiplier = min(1.5, 0.3 + (0.25 * year))  # Growing benefits
-            
-            annual_benefit = base_budget * benefit_multiplier * 3.2  # Average ROI of 3.2x
-            annual_benefit *= ((1 + gdp_growth) ** year)  # Adjust for economic growth
-            benefit_structure.append(annual_benefit)
+        # Cost structure (based on program maturity), one entry per year
+        year_index = np.arange(years)
+        
+        # Costs decrease due to economies of scale, after higher initial setup costs
+        cost_multiplier = np.where(year_index == 0, 1.2, 0.9 - 0.05 * np.minimum(year_index, 5))
+        cost_structure = base_budget * cost_multiplier * (1 + inflation) ** year_index
+        
+        # Benefits increase as program matures, from low initial benefits
+        benefit_multiplier = np.where(year_index == 0, 0.3, np.minimum(1.5, 0.3 + 0.25 * year_index))
+        benefit_structure = base_budget * benefit_multiplier * 3.2  # Average ROI of 3.2x
+        benefit_structure *= (1 + gdp_growth) ** year_index  # Adjust for economic growth
+        
+        net_structure = benefit_structure - cost_structure
         
         # Calculate NPV and IRR
         discount_rate = 0.08  # Social discount rate
-        npv = sum([(benefit_structure[i] - cost_structure[i]) / ((1 + discount_rate) ** i) 
-                   for i in range(years)])
+        npv = float(np.sum(net_structure / (1 + discount_rate) ** year_index))
         
         # Approximate IRR (would use scipy.optimize in production)
         irr = discount_rate + (npv / base_budget) * 0.05
         
-        # Payback period
-        cumulative_net = 0
-        payback_period = None
-        for i in range(years):
-            cumulative_net += benefit_structure[i] - cost_structure[i]
-            if cumulative_net > 0 and payback_period is None:
-                payback_period = i + 1
+        # Payback period: first year the cumulative net benefit turns positive
+        paid_back = np.flatnonzero(np.cumsum(net_structure) > 0)
+        payback_period = int(paid_back[0]) + 1 if paid_back.size else None
         
         return {
-            'costs': cost_structure,
-            'benefits': benefit_structure,
+            'costs': cost_structure.tolist(),
+            'benefits': benefit_structure.tolist(),
             'npv': npv,
             'irr': max(0.05, min(0.30, irr)),  # Realistic bounds
             'payback_period': payback_period or years + 1,
-            'benefit_cost_ratio': sum(benefit_structure) / sum(cost_structure)
+            'benefit_cost_ratio': float(benefit_structure.sum() / cost_structure.sum())
         }
     
     def get_monitoring_metrics(self, program_phase: str = 'implementation') -> Dict[str, Any]:
@@ -315,20 +314,23 @@ class NutritionDataConfig:
         
         adjustments = phase_adjustments.get(program_phase, phase_adjustments['implementation'])
         
-        # Add realistic variability
-        noise_factor = 0.1
+        # Add realistic variability, drawn in one batch
+        (coverage_noise, compliance_noise, stock_noise, quality_noise, feedback_noise,
+         cost_noise, stunting_noise, wasting_noise, anemia_noise) = _RNG.uniform(
+            _MONITORING_NOISE_LOW, _MONITORING_NOISE_HIGH
+        ).tolist()
         
         metrics = {
-            'coverage_rate': adjustments['coverage'] * 100 * (1 + np.random.uniform(-noise_factor, noise_factor)),
-            'compliance_rate': adjustments['compliance'] * 100 * (1 + np.random.uniform(-noise_factor, noise_factor)),
-            'stock_levels': 65 + np.random.uniform(-15, 20),  # More realistic range
-            'quality_scores': adjustments['quality'] * 100 * (1 + np.random.uniform(-0.05, 0.05)),
-            'beneficiary_feedback': 3.5 + adjustments['quality'] * 0.8 + np.random.uniform(-0.3, 0.3),
-            'cost_efficiency': 0.8 + adjustments['coverage'] * 0.3 + np.random.uniform(-0.1, 0.1),
+            'coverage_rate': adjustments['coverage'] * 100 * (1 + coverage_noise),
+            'compliance_rate': adjustments['compliance'] * 100 * (1 + compliance_noise),
+            'stock_levels': 65 + stock_noise,  # More realistic range
+            'quality_scores': adjustments['quality'] * 100 * (1 + quality_noise),
+            'beneficiary_feedback': 3.5 + adjustments['quality'] * 0.8 + feedback_noise,
+            'cost_efficiency': 0.8 + adjustments['coverage'] * 0.3 + cost_noise,
             'impact_indicators': {
-                'stunting_reduction': min(10, 2 + adjustments['coverage'] * 8 + np.random.uniform(-1, 1)),
-                'wasting_reduction': min(5, 1 + adjustments['coverage'] * 3 + np.random.uniform(-0.5, 0.5)),
-                'anemia_reduction': min(15, 3 + adjustments['coverage'] * 10 + np.random.uniform(-1.5, 1.5))
+                'stunting_reduction': min(10, 2 + adjustments['coverage'] * 8 + stunting_noise),
+                'wasting_reduction': min(5, 1 + adjustments['coverage'] * 3 + wasting_noise),
+                'anemia_reduction': min(15, 3 + adjustments['coverage'] * 10 + anemia_noise)
             }
         }
         
@@ -430,13 +432,10 @@ class NutritionDataConfig:
         
         # Simulate district characteristics
         if is_rural:
-            poverty_multiplier = np.random.uniform(1.2, 1.8)
-            health_access = np.random.uniform(0.3, 0.6)
-            malnutrition_multiplier = np.random.uniform(1.1, 1.4)
+            low, high = _RURAL_DISTRICT_LOW, _RURAL_DISTRICT_HIGH
         else:
-            poverty_multiplier = np.random.uniform(0.7, 1.0)
-            health_access = np.random.uniform(0.6, 0.9)
-            malnutrition_multiplier = np.random.uniform(0.8, 1.0)
+            low, high = _URBAN_DISTRICT_LOW, _URBAN_DISTRICT_HIGH
+        poverty_multiplier, health_access, malnutrition_multiplier = _RNG.uniform(low, high).tolist()
         
         baseline_stunting = self.get_stunting_rate()
         